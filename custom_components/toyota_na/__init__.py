@@ -6,9 +6,19 @@ import asyncio
 from toyota_na.auth import ToyotaOneAuth
 from toyota_na.client import ToyotaOneClient
 
+# Patch auth code, re-logins run on the entry's pooled session
+from .patch_auth import authorize, login, refresh_tokens, request_tokens
+ToyotaOneAuth.authorize = authorize
+ToyotaOneAuth.login = login
+ToyotaOneAuth.refresh_tokens = refresh_tokens
+ToyotaOneAuth.request_tokens = request_tokens
+
 # Patch client code
-from .patch_client import get_electric_status, api_request
+from .patch_client import __init__ as client_init, create_session, get_electric_status, api_get, api_post, api_request
+ToyotaOneClient.__init__ = client_init
 ToyotaOneClient.get_electric_status = get_electric_status
+ToyotaOneClient.api_get = api_get
+ToyotaOneClient.api_post = api_post
 ToyotaOneClient.api_request = api_request
 
 # Patch base_vehicle
@@ -33,16 +43,28 @@ from .patch_seventeen_cy import SeventeenCYToyotaVehicle
 toyota_na.vehicle.vehicle_generations.seventeen_cy.SeventeenCYToyotaVehicle = SeventeenCYToyotaVehicle
 
 from toyota_na.exceptions import AuthError, LoginError
-from toyota_na.vehicle.base_vehicle import RemoteRequestCommand, ToyotaVehicle
-
-#Patch get_vehicles
-from .patch_vehicle import get_vehicles
-#from toyota_na.vehicle.vehicle import get_vehicles
+from toyota_na.vehicle.base_vehicle import RemoteRequestCommand, ToyotaVehicle, VehicleFeatures
+
+from .cache import ResponseCache
+from .capabilities import EndpointCapabilities
+from .ratelimit import TokenBucket
+from .runtime_state import RuntimeState
+from .coordinator import ToyotaVehicleCoordinator
+from .governor import GOVERNOR_MAX_CONCURRENT, ConcurrencyGovernor, RequestPriority, prioritized
+from .latency import CommandLatencyTracker
+from .scheduler import EndpointPollScheduler, PollingMode
+from .snapshot import SNAPSHOT_STORAGE_VERSION, FeatureSnapshot
+from .stagger import stagger_delay
+from .token_manager import TOKEN_REFRESH_AHEAD, TokenManager
+from .vehicle_registry import ToyotaVehicleRegistry
+from .wake_budget import WakeBudget
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr, service
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -57,8 +79,29 @@ from .const import (
     REFRESH,
     UPDATE_INTERVAL,
     REFRESH_STATUS_INTERVAL,
+    VEHICLE_LIST_INTERVAL,
+    CAPABILITIES_STORAGE_KEY,
+    SNAPSHOT_STORAGE_KEY,
+    RUNTIME_STATE_STORAGE_KEY,
+    RESPONSE_CACHE_TTLS,
+    RESPONSE_CACHE_SIZE,
+    COMMAND_SETTLE_TIME,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    CONF_RATE_LIMIT,
+    CONF_RATE_LIMIT_BURST,
+    ENDPOINT_INTERVALS,
+    ADAPTIVE_IDLE_AFTER,
+    DEFAULT_ADAPTIVE_MIN_INTERVAL,
+    DEFAULT_ADAPTIVE_MAX_INTERVAL,
+    CONF_ADAPTIVE_MIN_INTERVAL,
+    CONF_ADAPTIVE_MAX_INTERVAL,
     CONF_UPDATE_INTERVAL,
-    CONF_REFRESH_STATUS_INTERVAL
+    CONF_REFRESH_STATUS_INTERVAL,
+    CONF_WAKE_DAILY_QUOTA,
+    DEFAULT_WAKE_DAILY_QUOTA,
+    WAKE_STAGGER_DELAY,
+    STARTUP_STAGGER_WINDOW,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -89,31 +132,41 @@ async def async_setup(hass: HomeAssistant, _processed_config) -> bool:
             _LOGGER.warning("Config entry not found")
             return
 
-        if "coordinator" not in hass.data[DOMAIN][entry_id]:
+        if "vehicle_coordinators" not in hass.data[DOMAIN][entry_id]:
             _LOGGER.warning("Coordinator not found")
             return
 
-        coordinator = hass.data[DOMAIN][entry_id]["coordinator"]
-
-        if coordinator.data is None:
-            _LOGGER.warning("No coordinator data")
-            return
+        vehicle_coordinators = hass.data[DOMAIN][entry_id]["vehicle_coordinators"]
 
         for identifier in device.identifiers:
             if identifier[0] == DOMAIN:
 
                 vin = identifier[1]
-                for vehicle in coordinator.data:
-                    if vehicle.vin == vin and remote_action.upper() == "REFRESH" and vehicle.subscribed:
+                vehicle_coordinator = vehicle_coordinators.get(vin)
+
+                if vehicle_coordinator is None or vehicle_coordinator.data is None:
+                    _LOGGER.warning("No coordinator data")
+                    continue
+
+                vehicle = vehicle_coordinator.vehicle
+                if remote_action.upper() == "REFRESH" and vehicle.subscribed:
+                    wake_budget = hass.data[DOMAIN][entry_id]["wake_budget"]
+                    # Someone is waiting for this refresh, it goes ahead of background polling
+                    with prioritized(RequestPriority.User):
+                        if not wake_budget.allow_user(vin):
+                            # Out of budget, serve what the servers know without waking up the vehicle
+                            _LOGGER.warning(f"Wake-up budget of vehicle {vin} spent, refreshing without waking it up")
+                            await vehicle_coordinator.async_request_full_refresh()
+                            continue
+                        last_timestamp = vehicle.features.get(VehicleFeatures.LastTimeStamp)
+                        wake_budget.record(vin)
                         await vehicle.poll_vehicle_refresh()
-                        # TODO: This works great and prevents us from unnecessarily hitting Toyota. But we can and should
-                        # probably do stuff like this in the library where we can better control which APIs we hit to refresh our in-memory data.
-                        coordinator.async_set_updated_data(coordinator.data)
-                        await asyncio.sleep(10)
-                        await coordinator.async_request_refresh()
-                    elif vehicle.vin == vin and vehicle.subscribed:
-                        await vehicle.send_command(COMMAND_MAP[remote_action])
-                        break
+                        # Only this vehicle is refreshed, as soon as it uploaded fresh data
+                        await vehicle_coordinator.async_refresh_after_wake(
+                            last_timestamp.value if last_timestamp is not None else None
+                        )
+                elif vehicle.subscribed:
+                    await vehicle_coordinator.command_queue.async_submit(COMMAND_MAP[remote_action])
 
                 _LOGGER.info("Handling service call %s for %s ", remote_action, vin)
 
@@ -133,141 +186,289 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up Toyota NA from a config entry."""
     hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
 
-    # Use a single client instance
+    # Use a single client instance backed by a pooled, keep-alive session
+    session = create_session()
+    hass.data[DOMAIN][entry.entry_id]["session"] = session
+
+    async def _async_close_session(_event: Event) -> None:
+        await session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+
+    # Tokens and refresh timestamps are saved in their own store, not in the config entry
+    runtime_state = RuntimeState(hass, f"{RUNTIME_STATE_STORAGE_KEY}.{entry.entry_id}")
+    await runtime_state.async_load()
+    # Entries set up by earlier versions kept the refresh timestamp in the config entry data
+    if runtime_state.last_refreshed_at is None and "last_refreshed_at" in entry.data:
+        runtime_state.set_last_refreshed_at(entry.data["last_refreshed_at"])
+    hass.data[DOMAIN][entry.entry_id]["runtime_state"] = runtime_state
+    tokens = runtime_state.newest_tokens(entry.data["tokens"])
+
+    auth = ToyotaOneAuth(
+        initial_tokens=tokens,
+        callback=runtime_state.set_tokens,
+        # Requests only refresh the tokens inline if the token manager fell behind
+        refresh_secs=-TOKEN_REFRESH_AHEAD,
+    )
+    # Logins and token refreshes reuse the pooled session and its cookie jar
+    auth.session = session
+    # Tokens are refreshed on a timer, falling back to the stored username/password
+    token_manager = TokenManager(hass, entry, auth, lambda: async_relogin(auth, entry))
+    hass.data[DOMAIN][entry.entry_id]["token_manager"] = token_manager
+
     client = ToyotaOneClient(
-        ToyotaOneAuth(
-            initial_tokens=entry.data["tokens"],
-            callback=lambda tokens: update_tokens(tokens, hass, entry),
-        )
+        auth,
+        session=session,
+        cache=ResponseCache(RESPONSE_CACHE_TTLS, RESPONSE_CACHE_SIZE, COMMAND_SETTLE_TIME),
+        rate_limiter=TokenBucket(
+            entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT) / 60,
+            entry.options.get(CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST),
+        ),
+        # Shared by the clients of every entry
+        governor=hass.data[DOMAIN].setdefault("governor", ConcurrencyGovernor(GOVERNOR_MAX_CONCURRENT)),
+        token_manager=token_manager,
     )
     
     # Initialize client with existing tokens
-    client.auth.set_tokens(entry.data["tokens"])
+    client.auth.set_tokens(tokens)
     
-    # Try to check tokens, but don't fail if it doesn't work
+    # Refresh the tokens now if they expire soon, logging in again if they can't be
     try:
-        await client.auth.check_tokens()
-    except AuthError:
-        _LOGGER.warning("Token refresh failed, attempting to re-login with username/password")
-        try:
-            await client.auth.login(entry.data["username"], entry.data["password"], None)
-        except Exception as e:
-            _LOGGER.error(f"Re-authentication failed: {str(e)}")
-            raise ConfigEntryAuthFailed("Failed to authenticate with Toyota API") from e
+        await token_manager.async_ensure_valid()
+    except ConfigEntryAuthFailed:
+        await session.close()
+        raise
+    except Exception as e:
+        await session.close()
+        raise ConfigEntryNotReady(f"Unable to validate Toyota credentials: {str(e)}") from e
+    token_manager.async_start()
+    entry.async_on_unload(token_manager.async_stop)
 
     # Store client in hass.data
     hass.data[DOMAIN][entry.entry_id]["toyota_na_client"] = client
 
+    # Confirmation polls of remote commands are scheduled from the latencies measured so far
+    hass.data[DOMAIN][entry.entry_id]["command_latencies"] = CommandLatencyTracker()
+
     # Get update interval from options or use default
     update_interval_seconds = entry.options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL)
+
+    # Each endpoint is polled on its own interval, adapted to the state of each vehicle
+    scheduler = EndpointPollScheduler(
+        {
+            endpoint: entry.options.get(option, default)
+            for endpoint, (option, default) in ENDPOINT_INTERVALS.items()
+        },
+        entry.options.get(CONF_ADAPTIVE_MIN_INTERVAL, DEFAULT_ADAPTIVE_MIN_INTERVAL),
+        entry.options.get(CONF_ADAPTIVE_MAX_INTERVAL, DEFAULT_ADAPTIVE_MAX_INTERVAL),
+        ADAPTIVE_IDLE_AFTER,
+    )
+
+    # Wake-ups are budgeted per vehicle, user requests have priority over scheduled ones
+    wake_budget = WakeBudget(
+        runtime_state,
+        entry.options.get(CONF_WAKE_DAILY_QUOTA, DEFAULT_WAKE_DAILY_QUOTA),
+        entry.options.get(CONF_REFRESH_STATUS_INTERVAL, REFRESH_STATUS_INTERVAL),
+    )
+    hass.data[DOMAIN][entry.entry_id]["wake_budget"] = wake_budget
+
+    # Endpoints a vehicle doesn't support are remembered across restarts
+    capabilities = EndpointCapabilities(hass, f"{CAPABILITIES_STORAGE_KEY}.{entry.entry_id}")
+    await capabilities.async_load()
+    hass.data[DOMAIN][entry.entry_id]["capabilities"] = capabilities
+
+    # Vehicle objects live for the lifetime of the config entry
+    registry = ToyotaVehicleRegistry(client, VEHICLE_LIST_INTERVAL, capabilities)
+    hass.data[DOMAIN][entry.entry_id]["vehicle_registry"] = registry
+
+    # Vehicles and features known at the last shutdown, entities start from them
+    snapshot = FeatureSnapshot(hass, f"{SNAPSHOT_STORAGE_KEY}.{entry.entry_id}", registry)
+    restored_vehicles = await snapshot.async_restore()
     
-    # Create coordinator with appropriate update interval
+    # The account coordinator refreshes the vehicle list and wakes up vehicles,
+    # vehicle data is fetched by one coordinator per vehicle
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
         name=DOMAIN,
-        update_method=lambda: update_vehicles_status(hass, client, entry),
+        update_method=lambda: update_vehicles_status(
+            hass, client, registry, runtime_state, wake_budget, scheduler, entry
+        ),
         update_interval=timedelta(seconds=update_interval_seconds),
     )
     
     # Store coordinator in hass.data
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator
     
-    # Do first refresh
-    await coordinator.async_config_entry_first_refresh()
+    if restored_vehicles:
+        # Warm start, the first live refresh runs in the background once the entities exist
+        coordinator.async_set_updated_data(registry.vehicles_by_vin)
+    else:
+        # Do first refresh
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await session.close()
+            raise
+
+    vehicle_coordinators = {
+        vehicle.vin: ToyotaVehicleCoordinator(
+            hass, vehicle, scheduler, update_interval_seconds, token_manager.async_reauthenticate
+        )
+        for vehicle in coordinator.data.values()
+    }
+    hass.data[DOMAIN][entry.entry_id]["vehicle_coordinators"] = vehicle_coordinators
+
+    @callback
+    def _async_save_snapshot() -> None:
+        snapshot.async_schedule_save()
+
+    for vehicle_coordinator in vehicle_coordinators.values():
+        entry.async_on_unload(vehicle_coordinator.async_add_listener(_async_save_snapshot))
+        entry.async_on_unload(vehicle_coordinator.command_queue.async_shutdown)
+
+    async def _async_refresh_vehicle(vehicle_coordinator: ToyotaVehicleCoordinator, window: float) -> None:
+        await asyncio.sleep(stagger_delay(vehicle_coordinator.vehicle.vin, window))
+        await vehicle_coordinator.async_refresh()
+
+    async def _async_refresh_vehicles(window: float = 0) -> None:
+        # A vehicle failing its first refresh must not hold back the others
+        await asyncio.gather(
+            *(
+                _async_refresh_vehicle(vehicle_coordinator, window)
+                for vehicle_coordinator in vehicle_coordinators.values()
+            )
+        )
 
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    @callback
+    def _async_check_vehicle_list() -> None:
+        """Reload the entry when vehicles were added, removed or replaced."""
+        if coordinator.data is None:
+            return
+        if coordinator.data.keys() != vehicle_coordinators.keys() or any(
+            vehicle_coordinators[vin].vehicle is not vehicle for vin, vehicle in coordinator.data.items()
+        ):
+            _LOGGER.info("Vehicle list changed, reloading Toyota NA entry")
+            hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_check_vehicle_list))
+
+    if restored_vehicles:
+        for vehicle_coordinator in vehicle_coordinators.values():
+            vehicle_coordinator.async_set_updated_data(vehicle_coordinator.vehicle)
+
+        # Set up platforms
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+        async def _async_warm_start_refresh() -> None:
+            # Accounts and vehicles restored together don't all call Toyota at once
+            await asyncio.sleep(stagger_delay(entry.entry_id, STARTUP_STAGGER_WINDOW))
+            await coordinator.async_refresh()
+            if coordinator.last_update_success:
+                await _async_refresh_vehicles(STARTUP_STAGGER_WINDOW)
+
+        entry.async_create_background_task(
+            hass, _async_warm_start_refresh(), f"{DOMAIN} {entry.entry_id} first refresh"
+        )
+    else:
+        await _async_refresh_vehicles()
+
+        # Set up platforms
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
-async def update_vehicles_status(hass: HomeAssistant, client: ToyotaOneClient, entry: ConfigEntry):
+async def update_vehicles_status(
+    hass: HomeAssistant,
+    client: ToyotaOneClient,
+    registry: ToyotaVehicleRegistry,
+    runtime_state: RuntimeState,
+    wake_budget: WakeBudget,
+    scheduler: EndpointPollScheduler,
+    entry: ConfigEntry,
+):
     """Update vehicle status."""
-    # Check if we need to refresh all vehicles
-    need_refresh = False
-    
-    # Get refresh interval from options
-    refresh_interval = entry.options.get(CONF_REFRESH_STATUS_INTERVAL, REFRESH_STATUS_INTERVAL)
-    need_refresh_before = datetime.utcnow().timestamp() - refresh_interval
-    
-    # Only do a full refresh if it's been longer than the refresh interval
-    # Skip the full refresh during initial startup to make it faster
-    if "last_refreshed_at" in entry.data and entry.data["last_refreshed_at"] < need_refresh_before:
-        need_refresh = True
-        _LOGGER.debug(f"Full refresh needed. Last refresh: {entry.data.get('last_refreshed_at')}")
-    elif "last_refreshed_at" not in entry.data:
-        # For first run, set last_refreshed_at without doing a full refresh
-        entry_data = dict(entry.data)
-        entry_data["last_refreshed_at"] = datetime.utcnow().timestamp()
-        hass.config_entries.async_update_entry(entry, data=entry_data)
-        _LOGGER.debug("First run - setting initial refresh timestamp without full refresh")
+    # Vehicles without a wake-up of their own are due from the last account-wide refresh
+    # Skip the wake-ups during initial startup to make it faster
+    if runtime_state.last_refreshed_at is None:
+        # For first run, set last_refreshed_at without waking up the vehicles
+        runtime_state.set_last_refreshed_at(datetime.utcnow().timestamp())
+        _LOGGER.debug("First run - setting initial refresh timestamp without waking up vehicles")
     
     try:
-        # Get vehicles with a single API call
-        _LOGGER.debug("Fetching vehicles from Toyota API")
-        raw_vehicles = await get_vehicles(client)
-        vehicles: list[ToyotaVehicle] = []
+        # Update the known vehicles in place, the vehicle list is only refetched when due
+        _LOGGER.debug("Updating vehicles from Toyota API")
+        vehicles: dict[str, ToyotaVehicle] = await registry.async_update()
         
         # Process each vehicle
         refresh_tasks = []
-        for vehicle in raw_vehicles:
+        for vehicle in vehicles.values():
             # Check subscription
             if vehicle.subscribed is not True:
                 _LOGGER.debug(
                     f"Vehicle {vehicle.vin} ({vehicle.model_year} {vehicle.model_name}) needs a subscription"
                 )
             
-            # Only refresh subscribed vehicles when needed
-            if need_refresh and vehicle.subscribed:
+            # Only wake up subscribed vehicles when due and within their wake-up budget
+            if vehicle.subscribed and wake_budget.allow_scheduled(
+                vehicle.vin, idle=scheduler.mode(vehicle.vin) is PollingMode.Idle
+            ):
                 _LOGGER.debug(f"Queueing refresh for vehicle {vehicle.vin}")
-                refresh_tasks.append(vehicle.poll_vehicle_refresh())
-            
-            # Add to list
-            vehicles.append(vehicle)
+                wake_budget.record(vehicle.vin)
+                refresh_tasks.append(async_wake_vehicle(vehicle, len(refresh_tasks) * WAKE_STAGGER_DELAY))
         
-        # Run all refresh tasks in parallel if needed
+        # Run all refresh tasks in parallel if needed, their starts staggered
         if refresh_tasks:
             _LOGGER.debug(f"Running {len(refresh_tasks)} vehicle refreshes in parallel")
             await asyncio.gather(*refresh_tasks, return_exceptions=True)
         
         # Update last refreshed timestamp
-        if need_refresh:
-            entry_data = dict(entry.data)
-            entry_data["last_refreshed_at"] = datetime.utcnow().timestamp()
-            hass.config_entries.async_update_entry(entry, data=entry_data)
+        if refresh_tasks:
+            runtime_state.set_last_refreshed_at(datetime.utcnow().timestamp())
         
         return vehicles
         
     except AuthError:
-        _LOGGER.warning("Authentication error during update, attempting to re-login")
+        _LOGGER.warning("Authentication error during update, attempting to re-authenticate")
         try:
-            # Try to login again
-            await client.auth.login(entry.data["username"], entry.data["password"], None)
-            
-            # Try again after successful login
-            raw_vehicles = await get_vehicles(client)
-            vehicles: list[ToyotaVehicle] = []
-            
-            for vehicle in raw_vehicles:
-                vehicles.append(vehicle)
-                
-            return vehicles
-            
+            # Refresh the tokens, or log in again if this episode hasn't already
+            await client.token_manager.async_reauthenticate()
+
+            # Try again after successful re-authentication, refetching the vehicle list as well
+            registry.request_vehicle_list_refresh()
+            return await registry.async_update()
+        except ConfigEntryAuthFailed:
+            raise
         except Exception as e:
-            _LOGGER.error(f"Re-authentication failed during update: {str(e)}")
-            raise ConfigEntryAuthFailed("Failed to authenticate with Toyota API") from e
+            _LOGGER.error(f"Error fetching vehicle data after re-authentication: {str(e)}")
+            raise UpdateFailed(f"Error updating vehicle data after re-authentication: {str(e)}") from e
+
+    except ConfigEntryAuthFailed:
+        # Logging in again failed, the coordinator starts the reauthentication flow
+        raise
             
     except Exception as e:
         _LOGGER.error(f"Error fetching vehicle data: {str(e)}")
         raise UpdateFailed(f"Error updating vehicle data: {str(e)}") from e
 
 
-def update_tokens(tokens: dict[str, str], hass: HomeAssistant, entry: ConfigEntry):
-    _LOGGER.info("Tokens refreshed, updating ConfigEntry")
-    data = dict(entry.data)
-    data["tokens"] = tokens
-    hass.config_entries.async_update_entry(entry, data=data)
+async def async_wake_vehicle(vehicle: ToyotaVehicle, delay: float) -> None:
+    """Wake up a vehicle after a delay."""
+    if delay:
+        await asyncio.sleep(delay)
+    await vehicle.poll_vehicle_refresh()
+
+
+async def async_relogin(auth: ToyotaOneAuth, entry: ConfigEntry) -> None:
+    """Log in again with the stored username/password."""
+    try:
+        await auth.login(entry.data["username"], entry.data["password"], None)
+    except Exception as e:
+        _LOGGER.error(f"Re-authentication failed: {str(e)}")
+        raise ConfigEntryAuthFailed("Failed to authenticate with Toyota API") from e
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -275,6 +476,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["session"].close()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data stored for a config entry."""
+    await EndpointCapabilities(hass, f"{CAPABILITIES_STORAGE_KEY}.{entry.entry_id}").async_remove()
+    await Store(hass, SNAPSHOT_STORAGE_VERSION, f"{SNAPSHOT_STORAGE_KEY}.{entry.entry_id}").async_remove()
+    await RuntimeState(hass, f"{RUNTIME_STATE_STORAGE_KEY}.{entry.entry_id}").async_remove()
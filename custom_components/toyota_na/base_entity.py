@@ -1,20 +1,24 @@
-from typing import Union
+from typing import Optional, Union
 
 from toyota_na.vehicle.base_vehicle import ToyotaVehicle, VehicleFeatures
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .coordinator import ToyotaVehicleCoordinator
 
 
-class ToyotaNABaseEntity(CoordinatorEntity[list[ToyotaVehicle]]):
+class ToyotaNABaseEntity(CoordinatorEntity[ToyotaVehicleCoordinator]):
+    # Features the state of the entity is derived from, None if it depends on all of them
+    _watched_features: Optional[frozenset[VehicleFeatures]] = None
+    # Availability and assumed state of the last state written
+    _written_flags: Optional[tuple[bool, bool]] = None
+
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[list[ToyotaVehicle]],
+        coordinator: ToyotaVehicleCoordinator,
         sensor_name: str,
         vin: str,
     ) -> None:
@@ -22,6 +26,23 @@ class ToyotaNABaseEntity(CoordinatorEntity[list[ToyotaVehicle]]):
         self.sensor_name = sensor_name
         self.vin = vin
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write the state when something the entity shows changed, most polls change nothing."""
+        if (self.available, self.assumed_state) == self._written_flags and not self._features_changed():
+            return
+        super()._handle_coordinator_update()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._written_flags = (self.available, self.assumed_state)
+        super().async_write_ha_state()
+
+    def _features_changed(self) -> bool:
+        if self.vehicle is None or self._watched_features is None:
+            return True
+        return not self._watched_features.isdisjoint(self.vehicle.changed_features)
+
     def feature(self, feature: VehicleFeatures):
         """Return the feature dict."""
         if self.vehicle is None:
@@ -33,7 +54,12 @@ class ToyotaNABaseEntity(CoordinatorEntity[list[ToyotaVehicle]]):
         """Return if entity is available."""
         # Only check if the vehicle exists in the coordinator data
         # This matches the original implementation's behavior
-        return next((v for v in self.coordinator.data if v.vin == self.vin), None) is not None
+        return self.vehicle is not None
+
+    @property
+    def assumed_state(self) -> bool:
+        """The state is assumed while the vehicle only has features restored from storage."""
+        return self.vehicle is not None and self.vehicle.stale
 
     @property
     def name(self):
@@ -67,6 +93,5 @@ class ToyotaNABaseEntity(CoordinatorEntity[list[ToyotaVehicle]]):
     @property
     def vehicle(self) -> Union[ToyotaVehicle, None]:
         """Return the vehicle."""
-        if not self.coordinator.data:
-            return None
-        return next((v for v in self.coordinator.data if v.vin == self.vin), None)
+        # Each vehicle has its own coordinator, whose data is the vehicle itself
+        return self.coordinator.data
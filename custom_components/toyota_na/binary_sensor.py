@@ -1,7 +1,7 @@
 from typing import Any, Union, cast
 import logging
 
-from toyota_na.vehicle.base_vehicle import ToyotaVehicle, VehicleFeatures
+from toyota_na.vehicle.base_vehicle import VehicleFeatures
 from toyota_na.vehicle.entity_types.ToyotaLockableOpening import ToyotaLockableOpening
 from toyota_na.vehicle.entity_types.ToyotaOpening import ToyotaOpening
 from toyota_na.vehicle.entity_types.ToyotaRemoteStart import ToyotaRemoteStart
@@ -13,9 +13,9 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .base_entity import ToyotaNABaseEntity
+from .coordinator import ToyotaVehicleCoordinator
 from .const import BINARY_SENSORS, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,11 +29,12 @@ async def async_setup_entry(
     """Set up the binary_sensor platform."""
     binary_sensors = []
 
-    coordinator: DataUpdateCoordinator[list[ToyotaVehicle]] = hass.data[DOMAIN][
+    vehicle_coordinators: dict[str, ToyotaVehicleCoordinator] = hass.data[DOMAIN][
         config_entry.entry_id
-    ]["coordinator"]
+    ]["vehicle_coordinators"]
 
-    for vehicle in coordinator.data:
+    for coordinator in vehicle_coordinators.values():
+        vehicle = coordinator.vehicle
         for feature_sensor in BINARY_SENSORS:
 
             entity_config = feature_sensor
@@ -54,7 +55,7 @@ async def async_setup_entry(
                     )
                 )
 
-    async_add_devices(binary_sensors, True)
+    async_add_devices(binary_sensors)
 
 
 class ToyotaBinarySensor(ToyotaNABaseEntity, BinarySensorEntity):
@@ -73,6 +74,13 @@ class ToyotaBinarySensor(ToyotaNABaseEntity, BinarySensorEntity):
         self._icon = icon
         self._device_class = device_class
         self._vehicle_feature = vehicle_feature
+        self._watched_features = frozenset({vehicle_feature})
+
+    def _features_changed(self) -> bool:
+        # The remaining time of a remote start changes without the feature changing
+        if self._vehicle_feature == VehicleFeatures.RemoteStartStatus and self.is_on:
+            return True
+        return super()._features_changed()
 
     @property
     def device_class(self):
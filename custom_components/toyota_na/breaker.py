@@ -0,0 +1,99 @@
+"""Circuit breaker for vehicle endpoints that keep failing."""
+from enum import Enum, unique
+import time
+from typing import Optional
+
+# Consecutive failures after which an endpoint is skipped
+BREAKER_FAILURE_THRESHOLD = 3
+# How long an open breaker skips its endpoint before probing it again, doubled after
+# every failed probe
+BREAKER_RESET_TIMEOUT = 300  # 5 minutes
+BREAKER_MAX_RESET_TIMEOUT = 21600  # 6 hours
+
+
+@unique
+class BreakerState(Enum):
+    Closed = "closed"
+    Open = "open"
+    HalfOpen = "half_open"
+
+
+class CircuitBreaker:
+    """Tracks the failures of one endpoint of one vehicle.
+
+    After `failure_threshold` consecutive failures the breaker opens and the
+    endpoint is skipped. Once the reset timeout elapsed a single probe call is
+    let through (half-open): success closes the breaker, failure reopens it
+    with a doubled timeout. A probe ending without a verdict (throttled,
+    authentication error, cancelled) reopens it with the same timeout.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        max_reset_timeout: float = BREAKER_MAX_RESET_TIMEOUT,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._base_reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._reset_timeout = reset_timeout
+        self._state = BreakerState.Closed
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> BreakerState:
+        return self._state
+
+    def allow(self, now: Optional[float] = None) -> bool:
+        """Return True if the endpoint may be called now."""
+        if self._state is BreakerState.Closed:
+            return True
+        if self._state is BreakerState.HalfOpen:
+            # A probe is already in flight
+            return False
+
+        if now is None:
+            now = time.monotonic()
+        if now - self._opened_at >= self._reset_timeout:
+            self._state = BreakerState.HalfOpen
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._state = BreakerState.Closed
+        self._failures = 0
+        self._reset_timeout = self._base_reset_timeout
+
+    def record_failure(self, now: Optional[float] = None) -> None:
+        if now is None:
+            now = time.monotonic()
+
+        if self._state is BreakerState.HalfOpen:
+            # Failed probe, back off further
+            self._reset_timeout = min(self._reset_timeout * 2, self._max_reset_timeout)
+            self._state = BreakerState.Open
+            self._opened_at = now
+            return
+
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            self._state = BreakerState.Open
+            self._opened_at = now
+
+    def release(self, now: Optional[float] = None) -> None:
+        """End a probe that neither succeeded nor failed, so a later one can be let through."""
+        if self._state is not BreakerState.HalfOpen:
+            return
+        if now is None:
+            now = time.monotonic()
+        self._state = BreakerState.Open
+        self._opened_at = now
+
+    def as_dict(self) -> dict:
+        return {
+            "state": self._state.value,
+            "failures": self._failures,
+            "reset_timeout": self._reset_timeout,
+        }
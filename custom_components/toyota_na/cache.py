@@ -0,0 +1,81 @@
+"""In-memory cache of Toyota API responses."""
+from collections import OrderedDict
+import logging
+import time
+from typing import Any, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+CacheKey = tuple[str, Optional[str], Optional[str]]
+
+
+def response_cache_key(endpoint: str, header_params: Optional[dict]) -> CacheKey:
+    """Build the (endpoint, VIN, generation) key of a GET request."""
+    header_params = header_params or {}
+    return (endpoint.lstrip("/"), header_params.get("VIN"), header_params.get("GENERATION"))
+
+
+class ResponseCache:
+    """LRU cache of API responses with a per-endpoint freshness policy.
+
+    Only endpoints with a TTL are cached. Remote commands and refresh
+    requests change what the vehicle reports, so they invalidate the cached
+    responses of their vehicle and keep it uncached while the command settles.
+    """
+
+    def __init__(self, ttls: dict[str, int], max_size: int, settle_time: int) -> None:
+        self._ttls = {endpoint.lstrip("/"): ttl for endpoint, ttl in ttls.items()}
+        self._max_size = max_size
+        self._settle_time = settle_time
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._settling_until: dict[Optional[str], float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: CacheKey) -> tuple[bool, Any]:
+        """Return (True, payload) for a fresh cached response, (False, None) otherwise."""
+        if key[0] not in self._ttls:
+            return False, None
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def set(self, key: CacheKey, payload: Any) -> None:
+        ttl = self._ttls.get(key[0])
+        if not ttl or self._settling(key[1]):
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, vin: Optional[str] = None) -> None:
+        """Drop the cached responses of a vehicle, and don't cache new ones until its command settled."""
+        if vin is None:
+            self._entries.clear()
+            return
+
+        for key in [key for key in self._entries if key[1] == vin]:
+            del self._entries[key]
+        self._settling_until[vin] = time.monotonic() + self._settle_time
+        _LOGGER.debug(f"Invalidated cached responses of vehicle {vin}")
+
+    def _settling(self, vin: Optional[str]) -> bool:
+        settling_until = self._settling_until.get(vin)
+        if settling_until is None:
+            return False
+        if settling_until < time.monotonic():
+            del self._settling_until[vin]
+            return False
+        return True
+
+    def as_dict(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
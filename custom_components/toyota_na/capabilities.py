@@ -0,0 +1,106 @@
+"""Persistent map of the endpoints each vehicle actually supports."""
+import logging
+import time
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .patch_base_vehicle import VehicleEndpoint
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPABILITIES_STORAGE_VERSION = 1
+# Delay before writing capability changes, so the outcomes of one update are saved together
+CAPABILITIES_SAVE_DELAY = 10
+# Endpoints found unsupported are probed again after this long, in case a subscription was added
+CAPABILITY_RECHECK_INTERVAL = 7 * 24 * 3600  # 1 week
+# Consecutive 400/404 responses after which an endpoint is considered unsupported, a single
+# error is often transient
+CAPABILITY_UNSUPPORTED_AFTER = 5
+
+
+class EndpointCapabilities:
+    """Records, per VIN, which endpoints return data and the shape of their response.
+
+    Support of an endpoint is a property of the vehicle and its subscription,
+    it doesn't change between restarts. Loading the map at setup lets vehicle
+    updates skip unsupported endpoints from the very first poll instead of
+    relearning it by failing.
+    """
+
+    def __init__(self, hass: HomeAssistant, storage_key: str) -> None:
+        self._store = Store(hass, CAPABILITIES_STORAGE_VERSION, storage_key)
+        self._capabilities: dict[str, dict[str, dict[str, Any]]] = {}
+        # Consecutive calls without data per VIN and endpoint, since the last call with data
+        self._unsupported_counts: dict[tuple[str, str], int] = {}
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load()
+        if data is not None:
+            self._capabilities = data.get("vehicles", {})
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def is_unsupported(self, vin: str, endpoint: VehicleEndpoint, now: Optional[float] = None) -> bool:
+        """Return True if the endpoint is known unsupported and not due for a recheck."""
+        capability = self._capabilities.get(vin, {}).get(endpoint.value)
+        if capability is None or capability["supported"]:
+            return False
+        # Entries saved before errors were counted may come from a single transient error
+        if capability.get("unsupported_count", 0) < CAPABILITY_UNSUPPORTED_AFTER:
+            return False
+        if now is None:
+            now = time.time()
+        return now - capability["checked_at"] < CAPABILITY_RECHECK_INTERVAL
+
+    def record(self, vin: str, endpoint: VehicleEndpoint, payload: Optional[Any]) -> None:
+        """Record the outcome of an endpoint call, None meaning the endpoint returned no usable data.
+
+        An endpoint is only marked unsupported after `CAPABILITY_UNSUPPORTED_AFTER`
+        consecutive calls without data.
+        """
+        key = (vin, endpoint.value)
+        if payload is None:
+            unsupported_count = self._unsupported_counts.get(key, 0) + 1
+            self._unsupported_counts[key] = unsupported_count
+            if unsupported_count < CAPABILITY_UNSUPPORTED_AFTER:
+                # Not conclusive yet, a single 400/404 is often transient
+                return
+        else:
+            self._unsupported_counts.pop(key, None)
+            unsupported_count = 0
+
+        vehicle = self._capabilities.setdefault(vin, {})
+        previous = vehicle.get(endpoint.value)
+        supported = payload is not None
+        shape = sorted(payload) if isinstance(payload, dict) else []
+
+        if previous is not None and previous["supported"] == supported and previous["shape"] == shape:
+            if supported:
+                # Nothing new, don't rewrite the file for every poll
+                return
+        elif previous is not None and previous["supported"] != supported:
+            _LOGGER.info(
+                f"{endpoint.value} is {'now' if supported else 'no longer'} supported by vehicle {vin}"
+            )
+        elif previous is not None:
+            _LOGGER.debug(f"{endpoint.value} response shape changed for vehicle {vin}: {shape}")
+
+        vehicle[endpoint.value] = {
+            "supported": supported,
+            "shape": shape,
+            "checked_at": time.time(),
+            "unsupported_count": unsupported_count,
+        }
+        self._store.async_delay_save(self._data_to_save, CAPABILITIES_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        return {"vehicles": self._capabilities}
+
+    def as_dict(self) -> list:
+        return [
+            {"vin": vin, "endpoints": endpoints}
+            for vin, endpoints in self._capabilities.items()
+        ]
@@ -0,0 +1,165 @@
+"""Per-vehicle queue of remote commands."""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from toyota_na.vehicle.base_vehicle import RemoteRequestCommand, ToyotaVehicle
+
+from .governor import RequestPriority, prioritized
+
+_LOGGER = logging.getLogger(__name__)
+
+# Commands acting on the same part of the vehicle, a later command supersedes an earlier one of its group
+COMMAND_GROUPS = {
+    RemoteRequestCommand.DoorLock: "doors",
+    RemoteRequestCommand.DoorUnlock: "doors",
+    RemoteRequestCommand.EngineStart: "engine",
+    RemoteRequestCommand.EngineStop: "engine",
+    RemoteRequestCommand.HazardsOn: "hazards",
+    RemoteRequestCommand.HazardsOff: "hazards",
+    RemoteRequestCommand.Refresh: "refresh",
+}
+
+# A command identical to one of its group whose confirmation was superseded while in flight isn't sent
+# again within this delay, it is only confirmed
+COMMAND_RESEND_AFTER = 60
+
+
+class _CommandJob:
+    def __init__(
+        self,
+        command: RemoteRequestCommand,
+        confirm: Optional[Callable[[], Awaitable[bool]]],
+        future: asyncio.Future,
+    ) -> None:
+        self.command = command
+        self.group = COMMAND_GROUPS[command]
+        self.confirm = confirm
+        self.future = future
+        self.superseded = False
+        self.confirm_task: Optional[asyncio.Task] = None
+
+    def supersede(self) -> None:
+        """Stop confirming the command, a later command of the group replaces it."""
+        self.superseded = True
+        if self.confirm_task is not None:
+            self.confirm_task.cancel()
+
+
+class VehicleCommandQueue:
+    """Serializes the remote commands of one vehicle.
+
+    Only one command is sent or confirmed at a time. A command submitted while
+    another one of the same group is queued replaces it (lock, unlock, lock
+    collapses to the last lock), and cancels the confirmation polling of the
+    one running, so no wake-ups are spent confirming a state nobody wants.
+    """
+
+    def __init__(self, vehicle: ToyotaVehicle) -> None:
+        self._vehicle = vehicle
+        self._pending: dict[str, _CommandJob] = {}
+        self._running: Optional[_CommandJob] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._last_sent: dict[str, tuple[RemoteRequestCommand, float]] = {}
+
+    async def async_submit(
+        self,
+        command: RemoteRequestCommand,
+        confirm: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> bool:
+        """Queue a command and wait until it was sent and confirmed.
+
+        `confirm` is awaited after the command was sent and returns whether the
+        vehicle reports the expected state. Returns False if the command was
+        superseded by a later one, or wasn't confirmed.
+        """
+        group = COMMAND_GROUPS[command]
+        pending = self._pending.get(group)
+        running = self._running
+
+        if pending is not None and pending.command is command:
+            return await asyncio.shield(pending.future)
+        if (
+            pending is None
+            and running is not None
+            and running.command is command
+            and not running.superseded
+        ):
+            # Already being sent or confirmed
+            return await asyncio.shield(running.future)
+
+        if pending is not None:
+            _LOGGER.debug(f"{command} supersedes queued {pending.command} for vehicle {self._vehicle.vin}")
+            del self._pending[group]
+            pending.future.set_result(False)
+        if running is not None and running.group == group and not running.superseded:
+            _LOGGER.debug(f"{command} supersedes running {running.command} for vehicle {self._vehicle.vin}")
+            running.supersede()
+
+        job = _CommandJob(command, confirm, asyncio.get_running_loop().create_future())
+        self._pending[group] = job
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._async_run())
+        return await asyncio.shield(job.future)
+
+    async def _async_run(self) -> None:
+        try:
+            while self._pending:
+                group = next(iter(self._pending))
+                job = self._running = self._pending.pop(group)
+                try:
+                    # Commands and their confirmation polls go ahead of any other request
+                    with prioritized(RequestPriority.Command):
+                        result = await self._async_execute(job)
+                except Exception as e:
+                    _LOGGER.error(f"Error running {job.command} for vehicle {self._vehicle.vin}: {e}")
+                    result = False
+                finally:
+                    self._running = None
+                if not job.future.done():
+                    job.future.set_result(result)
+        finally:
+            self._worker = None
+
+    async def _async_execute(self, job: _CommandJob) -> bool:
+        last_sent = self._last_sent.get(job.group)
+        if last_sent is not None and last_sent[0] is job.command and time.monotonic() - last_sent[1] < COMMAND_RESEND_AFTER:
+            _LOGGER.debug(f"{job.command} was just sent to vehicle {self._vehicle.vin}, only confirming it")
+        else:
+            self._last_sent.pop(job.group, None)
+            if not await self._vehicle.send_command(job.command):
+                return False
+            # In flight until confirmed, a superseding identical command doesn't send it again
+            self._last_sent[job.group] = (job.command, time.monotonic())
+
+        if job.superseded:
+            return False
+        if job.confirm is None:
+            # Nothing left in flight, a deliberate repeat is sent again
+            self._last_sent.pop(job.group, None)
+            return True
+
+        job.confirm_task = asyncio.ensure_future(job.confirm())
+        try:
+            # Unlike awaiting the task, waiting doesn't raise when the confirmation is cancelled
+            await asyncio.wait({job.confirm_task})
+            if job.confirm_task.cancelled():
+                return False
+            return job.confirm_task.result()
+        finally:
+            # Only a superseded command is still in flight, once confirmed or failed a repeat is sent again
+            if not job.confirm_task.cancelled():
+                self._last_sent.pop(job.group, None)
+
+    def async_shutdown(self) -> None:
+        """Cancel the queued commands and the one running."""
+        for job in self._pending.values():
+            job.future.set_result(False)
+        self._pending.clear()
+        if self._running is not None:
+            self._running.supersede()
+            if not self._running.future.done():
+                self._running.future.set_result(False)
+        if self._worker is not None:
+            self._worker.cancel()
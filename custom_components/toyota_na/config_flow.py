@@ -12,7 +12,7 @@ ToyotaOneAuth.authorize = authorize
 ToyotaOneAuth.login = login
 import json
 
-from .const import DOMAIN, CONF_USERNAME, CONF_PASSWORD, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, UPDATE_INTERVAL_OPTIONS, CONF_REFRESH_STATUS_INTERVAL, DEFAULT_REFRESH_STATUS_INTERVAL, REFRESH_STATUS_INTERVAL_OPTIONS
+from .const import DOMAIN, CONF_USERNAME, CONF_PASSWORD, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL, UPDATE_INTERVAL_OPTIONS, CONF_REFRESH_STATUS_INTERVAL, DEFAULT_REFRESH_STATUS_INTERVAL, REFRESH_STATUS_INTERVAL_OPTIONS, CONF_TELEMETRY_INTERVAL, DEFAULT_TELEMETRY_INTERVAL, CONF_VEHICLE_STATUS_INTERVAL, DEFAULT_VEHICLE_STATUS_INTERVAL, CONF_ENGINE_STATUS_INTERVAL, DEFAULT_ENGINE_STATUS_INTERVAL, CONF_ELECTRIC_STATUS_INTERVAL, DEFAULT_ELECTRIC_STATUS_INTERVAL, ENDPOINT_INTERVAL_OPTIONS, CONF_ADAPTIVE_MIN_INTERVAL, DEFAULT_ADAPTIVE_MIN_INTERVAL, ADAPTIVE_MIN_INTERVAL_OPTIONS, CONF_ADAPTIVE_MAX_INTERVAL, DEFAULT_ADAPTIVE_MAX_INTERVAL, ADAPTIVE_MAX_INTERVAL_OPTIONS, CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT, RATE_LIMIT_OPTIONS, CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST, RATE_LIMIT_BURST_OPTIONS, CONF_WAKE_DAILY_QUOTA, DEFAULT_WAKE_DAILY_QUOTA, WAKE_DAILY_QUOTA_OPTIONS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -115,6 +115,15 @@ class ToyotaNAOptionsFlow(config_entries.OptionsFlow):
         # Get current values or use defaults
         update_interval = options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
         refresh_status_interval = options.get(CONF_REFRESH_STATUS_INTERVAL, DEFAULT_REFRESH_STATUS_INTERVAL)
+        wake_daily_quota = options.get(CONF_WAKE_DAILY_QUOTA, DEFAULT_WAKE_DAILY_QUOTA)
+        telemetry_interval = options.get(CONF_TELEMETRY_INTERVAL, DEFAULT_TELEMETRY_INTERVAL)
+        vehicle_status_interval = options.get(CONF_VEHICLE_STATUS_INTERVAL, DEFAULT_VEHICLE_STATUS_INTERVAL)
+        engine_status_interval = options.get(CONF_ENGINE_STATUS_INTERVAL, DEFAULT_ENGINE_STATUS_INTERVAL)
+        electric_status_interval = options.get(CONF_ELECTRIC_STATUS_INTERVAL, DEFAULT_ELECTRIC_STATUS_INTERVAL)
+        adaptive_min_interval = options.get(CONF_ADAPTIVE_MIN_INTERVAL, DEFAULT_ADAPTIVE_MIN_INTERVAL)
+        adaptive_max_interval = options.get(CONF_ADAPTIVE_MAX_INTERVAL, DEFAULT_ADAPTIVE_MAX_INTERVAL)
+        rate_limit = options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT)
+        rate_limit_burst = options.get(CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST)
 
         # Create options form
         options_schema = vol.Schema(
@@ -129,6 +138,51 @@ class ToyotaNAOptionsFlow(config_entries.OptionsFlow):
                     default=refresh_status_interval,
                     description="Vehicle Wake-up Frequency"
                 ): vol.In(REFRESH_STATUS_INTERVAL_OPTIONS),
+                vol.Required(
+                    CONF_WAKE_DAILY_QUOTA,
+                    default=wake_daily_quota,
+                    description="Vehicle Wake-ups per Day"
+                ): vol.In(WAKE_DAILY_QUOTA_OPTIONS),
+                vol.Required(
+                    CONF_TELEMETRY_INTERVAL,
+                    default=telemetry_interval,
+                    description="Odometer/Fuel/Tire Check Frequency"
+                ): vol.In(ENDPOINT_INTERVAL_OPTIONS),
+                vol.Required(
+                    CONF_VEHICLE_STATUS_INTERVAL,
+                    default=vehicle_status_interval,
+                    description="Door/Lock/Window Check Frequency"
+                ): vol.In(ENDPOINT_INTERVAL_OPTIONS),
+                vol.Required(
+                    CONF_ENGINE_STATUS_INTERVAL,
+                    default=engine_status_interval,
+                    description="Remote Start Check Frequency"
+                ): vol.In(ENDPOINT_INTERVAL_OPTIONS),
+                vol.Required(
+                    CONF_ELECTRIC_STATUS_INTERVAL,
+                    default=electric_status_interval,
+                    description="EV Charge Check Frequency"
+                ): vol.In(ENDPOINT_INTERVAL_OPTIONS),
+                vol.Required(
+                    CONF_ADAPTIVE_MIN_INTERVAL,
+                    default=adaptive_min_interval,
+                    description="Check Frequency While Driving/Charging"
+                ): vol.In(ADAPTIVE_MIN_INTERVAL_OPTIONS),
+                vol.Required(
+                    CONF_ADAPTIVE_MAX_INTERVAL,
+                    default=adaptive_max_interval,
+                    description="Check Frequency While Parked"
+                ): vol.In(ADAPTIVE_MAX_INTERVAL_OPTIONS),
+                vol.Required(
+                    CONF_RATE_LIMIT,
+                    default=rate_limit,
+                    description="Maximum API Call Rate"
+                ): vol.In(RATE_LIMIT_OPTIONS),
+                vol.Required(
+                    CONF_RATE_LIMIT_BURST,
+                    default=rate_limit_burst,
+                    description="API Call Burst"
+                ): vol.In(RATE_LIMIT_BURST_OPTIONS),
             }
         )
 
@@ -144,11 +198,27 @@ class ToyotaNAOptionsFlow(config_entries.OptionsFlow):
                                "• Recommended: 5-15 minutes for regular use\n"
                                "• Use shorter intervals (1-5 min) if you need more responsive updates\n"
                                "• Use longer intervals (30-60 min) to reduce API calls if you're experiencing errors",
+                "endpoint_info": "**Per-data Check Frequencies**: How often each kind of data is fetched.\n\n"
+                                 "• The API Check Frequency is the longest the integration waits between checks\n"
+                                 "• Odometer, fuel and tire pressures change slowly and can be checked rarely\n"
+                                 "• Doors, locks and remote start benefit from shorter intervals",
+                "adaptive_info": "**Adaptive Check Frequencies**: Bounds for the per-data frequencies.\n\n"
+                                 "• While driving, charging or remote started everything is checked at the driving/charging frequency\n"
+                                 "• Once the vehicle is locked and hasn't reported for an hour, everything is checked at the parked frequency",
+                "rate_limit_info": "**API Call Rate**: How fast this account may call Toyota's servers.\n\n"
+                                   "• Calls beyond the burst are queued and paced at the maximum rate\n"
+                                   "• When Toyota asks us to slow down, calls wait as long as requested before retrying\n"
+                                   "• Lower the rate if you're seeing throttling errors with several vehicles",
                 "refresh_info": "**Vehicle Wake-up Frequency**: How often Toyota's servers ping your vehicle for fresh data.\n\n"
                                 "• This operation wakes up your vehicle to get fresh data\n"
                                 "• Has a higher impact on your vehicle's battery\n"
                                 "• Recommended: 1-2 hours for most users\n"
                                 "• Use longer intervals (4-8 hours) if you're concerned about battery drain\n"
-                                "• Shorter intervals provide more up-to-date information but increase battery usage"
+                                "• Shorter intervals provide more up-to-date information but increase battery usage",
+                "wake_quota_info": "**Vehicle Wake-ups per Day**: How many times each vehicle may be woken up within 24 hours.\n\n"
+                                   "• Each vehicle has its own budget, vehicles are no longer woken up together\n"
+                                   "• Two wake-ups are always kept for refreshes you request yourself\n"
+                                   "• Vehicles parked and locked for a while are woken up on schedule at most once a day\n"
+                                   "• Use a lower quota for vehicles parked for weeks"
             }
         )
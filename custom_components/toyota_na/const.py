@@ -6,6 +6,8 @@ from homeassistant.const import PERCENTAGE, UnitOfPressure, CONF_USERNAME, CONF_
 
 from toyota_na.vehicle.base_vehicle import RemoteRequestCommand
 
+from .patch_base_vehicle import VehicleEndpoint
+
 
 DOMAIN = "toyota_na"
 
@@ -21,6 +23,55 @@ REFRESH = "refresh"
 DEFAULT_UPDATE_INTERVAL = 300  # 5 minutes
 DEFAULT_REFRESH_STATUS_INTERVAL = 3600  # 1 hour
 
+# Storage of the endpoints each vehicle supports, suffixed with the config entry id
+CAPABILITIES_STORAGE_KEY = f"{DOMAIN}.capabilities"
+# Storage of the last known vehicle features, suffixed with the config entry id
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshot"
+# Storage of tokens, refresh timestamps and wake-up counters, suffixed with the config entry id
+RUNTIME_STATE_STORAGE_KEY = f"{DOMAIN}.runtime"
+
+# How often the user vehicle list (subscriptions, nicknames, generation) is refetched
+VEHICLE_LIST_INTERVAL = 21600  # 6 hours
+
+# Freshness of cached API responses per endpoint (in seconds). Endpoints not listed
+# are never cached. Kept well below the polling intervals so scheduled polls always
+# reach Toyota, while diagnostics, services and bursts of automations are served from memory.
+RESPONSE_CACHE_TTLS = {
+    "v2/vehicle/guid": 3600,
+    "v2/telemetry": 30,
+    "v1/global/remote/status": 15,
+    "v2/legacy/remote/status": 15,
+    "v1/global/remote/engine-status": 15,
+    "v1/legacy/remote/engine-status": 15,
+    "v2/electric/status": 30,
+}
+RESPONSE_CACHE_SIZE = 128
+# How long responses of a vehicle stay uncached after a remote command or refresh request
+COMMAND_SETTLE_TIME = 120
+
+# Default pacing of Toyota API calls per account
+DEFAULT_RATE_LIMIT = 30  # calls per minute
+DEFAULT_RATE_LIMIT_BURST = 10
+
+# Default per-endpoint polling intervals
+DEFAULT_TELEMETRY_INTERVAL = 900  # 15 minutes, odometer/tires/fuel change slowly
+DEFAULT_VEHICLE_STATUS_INTERVAL = 300  # 5 minutes, doors/locks/windows
+DEFAULT_ENGINE_STATUS_INTERVAL = 300  # 5 minutes, remote start
+DEFAULT_ELECTRIC_STATUS_INTERVAL = 600  # 10 minutes, EV charge status
+
+# Adaptive polling bounds: driving/charging/remote started vehicles are polled at the
+# minimum interval, vehicles parked and locked for a while at the maximum interval
+DEFAULT_ADAPTIVE_MIN_INTERVAL = 60  # 1 minute
+DEFAULT_ADAPTIVE_MAX_INTERVAL = 3600  # 1 hour
+ADAPTIVE_IDLE_AFTER = 3600  # LastTimeStamp unchanged for 1 hour
+
+# Default number of wake-ups of a vehicle within 24 hours
+DEFAULT_WAKE_DAILY_QUOTA = 12
+# Delay between the starts of wake-ups due at the same update
+WAKE_STAGGER_DELAY = 5
+# Window the first refreshes after a restart are spread over, per account and per vehicle
+STARTUP_STAGGER_WINDOW = 30
+
 # Current update intervals (can be changed via options flow)
 UPDATE_INTERVAL = DEFAULT_UPDATE_INTERVAL
 REFRESH_STATUS_INTERVAL = DEFAULT_REFRESH_STATUS_INTERVAL
@@ -28,6 +79,15 @@ REFRESH_STATUS_INTERVAL = DEFAULT_REFRESH_STATUS_INTERVAL
 # Options
 CONF_UPDATE_INTERVAL = "update_interval"
 CONF_REFRESH_STATUS_INTERVAL = "refresh_status_interval"
+CONF_TELEMETRY_INTERVAL = "telemetry_interval"
+CONF_VEHICLE_STATUS_INTERVAL = "vehicle_status_interval"
+CONF_ENGINE_STATUS_INTERVAL = "engine_status_interval"
+CONF_ELECTRIC_STATUS_INTERVAL = "electric_status_interval"
+CONF_ADAPTIVE_MIN_INTERVAL = "adaptive_min_interval"
+CONF_ADAPTIVE_MAX_INTERVAL = "adaptive_max_interval"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_LIMIT_BURST = "rate_limit_burst"
+CONF_WAKE_DAILY_QUOTA = "wake_daily_quota"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 
@@ -41,6 +101,61 @@ UPDATE_INTERVAL_OPTIONS = {
     3600: "1 hour"
 }
 
+# Per-endpoint polling interval options (in seconds)
+ENDPOINT_INTERVAL_OPTIONS = {
+    60: "1 minute",
+    300: "5 minutes",
+    600: "10 minutes",
+    900: "15 minutes",
+    1800: "30 minutes",
+    3600: "1 hour",
+    7200: "2 hours",
+}
+
+# Adaptive polling bound options (in seconds)
+ADAPTIVE_MIN_INTERVAL_OPTIONS = {
+    60: "1 minute",
+    120: "2 minutes",
+    300: "5 minutes",
+}
+
+ADAPTIVE_MAX_INTERVAL_OPTIONS = {
+    1800: "30 minutes",
+    3600: "1 hour",
+    7200: "2 hours",
+    14400: "4 hours",
+}
+
+# API rate limit options (calls per minute)
+RATE_LIMIT_OPTIONS = {
+    10: "10 calls per minute",
+    30: "30 calls per minute",
+    60: "60 calls per minute",
+    120: "120 calls per minute",
+}
+
+RATE_LIMIT_BURST_OPTIONS = {
+    5: "5 calls",
+    10: "10 calls",
+    20: "20 calls",
+}
+
+# Vehicle wake-up quota options (wake-ups per vehicle within 24 hours)
+WAKE_DAILY_QUOTA_OPTIONS = {
+    4: "4 wake-ups per day",
+    8: "8 wake-ups per day",
+    12: "12 wake-ups per day",
+    24: "24 wake-ups per day",
+}
+
+# Options key and default interval of each polled endpoint
+ENDPOINT_INTERVALS = {
+    VehicleEndpoint.Telemetry: (CONF_TELEMETRY_INTERVAL, DEFAULT_TELEMETRY_INTERVAL),
+    VehicleEndpoint.VehicleStatus: (CONF_VEHICLE_STATUS_INTERVAL, DEFAULT_VEHICLE_STATUS_INTERVAL),
+    VehicleEndpoint.EngineStatus: (CONF_ENGINE_STATUS_INTERVAL, DEFAULT_ENGINE_STATUS_INTERVAL),
+    VehicleEndpoint.ElectricStatus: (CONF_ELECTRIC_STATUS_INTERVAL, DEFAULT_ELECTRIC_STATUS_INTERVAL),
+}
+
 # Refresh status interval options (in seconds)
 REFRESH_STATUS_INTERVAL_OPTIONS = {
     1800: "30 minutes",
@@ -399,3 +514,17 @@ SENSORS = [
         "electric": True,
     },
 ]
+
+# Diagnostic sensors of the measured command confirmation latencies
+COMMAND_LATENCY_SENSORS = [
+    {
+        "command": RemoteRequestCommand.DoorLock,
+        "icon": "mdi:timer-lock-outline",
+        "name": "Lock Confirmation Time",
+    },
+    {
+        "command": RemoteRequestCommand.DoorUnlock,
+        "icon": "mdi:timer-lock-open-outline",
+        "name": "Unlock Confirmation Time",
+    },
+]
@@ -0,0 +1,141 @@
+"""Per-vehicle update coordinators for Toyota NA."""
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from toyota_na.vehicle.base_vehicle import ToyotaVehicle, VehicleFeatures
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .commands import VehicleCommandQueue
+from .const import DOMAIN
+from .patch_base_vehicle import VehicleEndpoint, is_auth_error
+from .scheduler import EndpointPollScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+# Telemetry polls watching for fresh data after a wake-up, backing off from the initial to the max delay
+REFRESH_POLL_INITIAL_DELAY = 2
+REFRESH_POLL_BACKOFF = 1.5
+REFRESH_POLL_MAX_DELAY = 10
+# Give up waiting for the vehicle after this long and fetch whatever Toyota has
+REFRESH_WAIT_TIMEOUT = 90
+
+
+class ToyotaVehicleCoordinator(DataUpdateCoordinator[ToyotaVehicle]):
+    """Updates a single vehicle on its own schedule.
+
+    Each vehicle gets its own coordinator so a slow or failing vehicle doesn't
+    delay, or fail, the updates of the other vehicles of the account.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        vehicle: ToyotaVehicle,
+        scheduler: EndpointPollScheduler,
+        max_update_interval: int,
+        reauthenticate: Callable[[], Awaitable[None]],
+    ) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {vehicle.vin}",
+            update_interval=timedelta(seconds=max_update_interval),
+        )
+        self.vehicle = vehicle
+        self.command_queue = VehicleCommandQueue(vehicle)
+        self._scheduler = scheduler
+        self._max_update_interval = max_update_interval
+        self._reauthenticate = reauthenticate
+        self._requested_endpoints: Optional[set[VehicleEndpoint]] = None
+
+    async def async_request_full_refresh(self) -> None:
+        """Refresh every endpoint of the vehicle, whether it is due or not."""
+        self._requested_endpoints = set(VehicleEndpoint)
+        await self.async_request_refresh()
+
+    async def async_refresh_after_wake(self, last_timestamp: Any) -> bool:
+        """Wait for the vehicle to upload fresh data after a wake-up, then refresh it.
+
+        `last_timestamp` is the LastTimeStamp value from before the wake-up.
+        Only telemetry is polled until it advances, then the other endpoints
+        are fetched once. Returns False if the vehicle didn't answer in time,
+        or if telemetry isn't being fetched.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + REFRESH_WAIT_TIMEOUT
+        delay = REFRESH_POLL_INITIAL_DELAY
+        fresh = False
+        telemetry_skipped = False
+
+        while loop.time() + delay < deadline:
+            await asyncio.sleep(delay)
+            await self.vehicle.update({VehicleEndpoint.Telemetry})
+            if VehicleEndpoint.Telemetry not in self.vehicle.fetched_endpoints:
+                # Skipped by its circuit breaker or unsupported, waiting won't tell when data is fresh
+                _LOGGER.debug(f"Telemetry of vehicle {self.vehicle.vin} isn't being fetched, not waiting for fresh data")
+                telemetry_skipped = True
+                break
+            self._scheduler.mark_polled(self.vehicle.vin, {VehicleEndpoint.Telemetry})
+            timestamp = self.vehicle.features.get(VehicleFeatures.LastTimeStamp)
+            if timestamp is not None and timestamp.value != last_timestamp:
+                fresh = True
+                break
+            delay = min(delay * REFRESH_POLL_BACKOFF, REFRESH_POLL_MAX_DELAY)
+
+        if fresh:
+            _LOGGER.debug(f"Vehicle {self.vehicle.vin} reported fresh data")
+            self._requested_endpoints = set(VehicleEndpoint) - {VehicleEndpoint.Telemetry}
+        else:
+            if not telemetry_skipped:
+                _LOGGER.warning(f"Vehicle {self.vehicle.vin} didn't report fresh data within {REFRESH_WAIT_TIMEOUT} seconds")
+            self._requested_endpoints = set(VehicleEndpoint)
+        await self.async_refresh()
+        return fresh
+
+    @callback
+    def async_update_listeners(self) -> None:
+        super().async_update_listeners()
+        # Every entity has seen the changes, start collecting the next ones
+        self.vehicle.clear_changed_features()
+
+    async def _async_update_data(self) -> ToyotaVehicle:
+        vin = self.vehicle.vin
+        if self._requested_endpoints is not None:
+            due = self._requested_endpoints
+            self._requested_endpoints = None
+        else:
+            due = self._scheduler.due_endpoints(vin)
+
+        try:
+            if due:
+                _LOGGER.debug(f"Updating {sorted(endpoint.value for endpoint in due)} for vehicle {vin}")
+                self._scheduler.mark_polled(vin, due)
+                await self.vehicle.update(due)
+                self._scheduler.observe(self.vehicle)
+                await self._async_raise_if_all_failed()
+        finally:
+            # Tick again as soon as the next endpoint is due, but at least every update interval
+            next_poll_in = self._scheduler.next_poll_in([vin])
+            self.update_interval = timedelta(seconds=min(next_poll_in, self._max_update_interval))
+
+        return self.vehicle
+
+    async def _async_raise_if_all_failed(self) -> None:
+        errors = self.vehicle.endpoint_errors
+        fetched = self.vehicle.fetched_endpoints
+        if not fetched or len(errors) < len(fetched):
+            return
+
+        for error in errors.values():
+            if isinstance(error, ConfigEntryAuthFailed):
+                # Logging in again failed, let Home Assistant ask for credentials
+                raise error
+        if any(is_auth_error(error) for error in errors.values()):
+            _LOGGER.warning(f"Authentication error while updating vehicle {self.vehicle.vin}, attempting to re-login")
+            await self._reauthenticate()
+        raise UpdateFailed(f"Every endpoint failed for vehicle {self.vehicle.vin}")
@@ -10,9 +10,9 @@ from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .base_entity import ToyotaNABaseEntity
+from .coordinator import ToyotaVehicleCoordinator
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,11 +31,12 @@ async def async_setup_entry(
     """Set up the device_tracker platform."""
     locations = []
 
-    coordinator: DataUpdateCoordinator[list[ToyotaVehicle]] = hass.data[DOMAIN][
+    vehicle_coordinators: dict[str, ToyotaVehicleCoordinator] = hass.data[DOMAIN][
         config_entry.entry_id
-    ]["coordinator"]
+    ]["vehicle_coordinators"]
 
-    for vehicle in coordinator.data:
+    for coordinator in vehicle_coordinators.values():
+        vehicle = coordinator.vehicle
         for feature_sensor in features_sensors:
             feature = vehicle.features.get(
                 cast(VehicleFeatures, feature_sensor["feature"])
@@ -54,7 +55,7 @@ async def async_setup_entry(
                     )
                 )
 
-    async_add_devices(locations, True)
+    async_add_devices(locations)
 
 
 class ToyotaDeviceTracker(ToyotaNABaseEntity, TrackerEntity):
@@ -64,6 +65,7 @@ class ToyotaDeviceTracker(ToyotaNABaseEntity, TrackerEntity):
     def __init__(self, feature: VehicleFeatures, *args: Any):
         super().__init__(*args)
         self._feature = feature
+        self._watched_features = frozenset({feature})
 
     @property
     def icon(self) -> str:
@@ -15,6 +15,7 @@ import logging
 _LOGGER = logging.getLogger(__name__)
 
 from .const import DOMAIN
+from .vehicle_registry import ToyotaVehicleRegistry
 
 TO_REDACT = {
     CONF_ACCESS_TOKEN,
@@ -39,6 +40,9 @@ async def async_get_config_entry_diagnostics(
     client: ToyotaOneClient = hass.data[DOMAIN][config_entry.entry_id][
         "toyota_na_client"
     ]
+    registry: ToyotaVehicleRegistry = hass.data[DOMAIN][config_entry.entry_id][
+        "vehicle_registry"
+    ]
 
     # We don't directly expose this from the vehicle api abstraction, but it's critical to dump this in diagnostics for debugging
     user_vehicle_list = await client.get_user_vehicle_list()
@@ -101,6 +105,24 @@ async def async_get_config_entry_diagnostics(
             "telemetry": {"data": telemetry},
             "engine_status": {"data": engine_status},
             "electric_status": {"data": electric_status},
+            "response_cache": client.cache.as_dict() if client.cache is not None else None,
+            "rate_limiter": client.rate_limiter.as_dict() if client.rate_limiter is not None else None,
+            "runtime_state": hass.data[DOMAIN][config_entry.entry_id]["runtime_state"].as_dict(),
+            "token_manager": hass.data[DOMAIN][config_entry.entry_id]["token_manager"].as_dict(),
+            "governor": hass.data[DOMAIN]["governor"].as_dict(),
+            "wake_budget": hass.data[DOMAIN][config_entry.entry_id]["wake_budget"].as_dict(),
+            "command_latencies": hass.data[DOMAIN][config_entry.entry_id]["command_latencies"].as_dict(),
+            "capabilities": hass.data[DOMAIN][config_entry.entry_id]["capabilities"].as_dict(),
+            "circuit_breakers": [
+                {
+                    "vin": vehicle.vin,
+                    "endpoints": {
+                        endpoint.value: breaker.as_dict()
+                        for endpoint, breaker in vehicle.endpoint_breakers.items()
+                    },
+                }
+                for vehicle in registry.vehicles
+            ],
         },
         TO_REDACT,
     )
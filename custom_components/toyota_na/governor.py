@@ -0,0 +1,131 @@
+"""Integration-wide bound on concurrent Toyota API requests, shared by every config entry."""
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+import heapq
+import itertools
+import logging
+import time
+from typing import AsyncIterator, Iterator, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# Requests in flight at once across every account
+GOVERNOR_MAX_CONCURRENT = 6
+
+
+class RequestPriority(IntEnum):
+    """Order in which queued requests get a slot, lowest first."""
+
+    Command = 0
+    User = 1
+    Background = 2
+
+
+# Priority of the requests made by the current task, background polling unless set otherwise
+request_priority: ContextVar[RequestPriority] = ContextVar(
+    "toyota_na_request_priority", default=RequestPriority.Background
+)
+
+
+@contextmanager
+def prioritized(priority: RequestPriority) -> Iterator[None]:
+    """Make the requests of the current task, and the tasks it starts, use `priority`."""
+    token = request_priority.set(priority)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+class _PriorityStats:
+    def __init__(self) -> None:
+        self.acquired = 0
+        self.queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "acquired": self.acquired,
+            "queued": self.queued,
+            "total_wait": round(self.total_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+class ConcurrencyGovernor:
+    """Priority semaphore every Toyota client of the instance sends its requests through.
+
+    At most `max_concurrent` requests are in flight at once. When all slots
+    are taken, requests queue by priority and then in arrival order, so
+    remote commands and user refreshes overtake background polling.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        self._max_concurrent = max_concurrent
+        self._in_flight = 0
+        self._waiters: list[tuple[RequestPriority, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._stats = {priority: _PriorityStats() for priority in RequestPriority}
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    @asynccontextmanager
+    async def slot(self, priority: Optional[RequestPriority] = None) -> AsyncIterator[None]:
+        """Hold a slot for the duration of a request."""
+        if priority is None:
+            priority = request_priority.get()
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        stats = self._stats[priority]
+        if self._in_flight < self._max_concurrent and not self.queue_depth:
+            self._in_flight += 1
+            stats.acquired += 1
+            return
+
+        started_at = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancellation
+                self._release()
+            raise
+
+        waited = time.monotonic() - started_at
+        stats.acquired += 1
+        stats.queued += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+        _LOGGER.debug(f"Toyota API request ({priority.name}) queued for {waited:.2f}s by the governor")
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # The slot goes straight to the next waiter
+                future.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def as_dict(self) -> dict:
+        return {
+            "max_concurrent": self._max_concurrent,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "priorities": {priority.name: stats.as_dict() for priority, stats in self._stats.items()},
+        }
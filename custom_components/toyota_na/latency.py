@@ -0,0 +1,78 @@
+"""Measured command-to-confirmation latencies, used to schedule confirmation polls."""
+from collections import deque
+import math
+from typing import Optional
+
+from toyota_na.vehicle.base_vehicle import ApiVehicleGeneration, RemoteRequestCommand
+
+# Confirmation poll schedule used until enough latencies were measured, in seconds after the command was sent
+DEFAULT_CONFIRMATION_SCHEDULE = (1, 2, 3, 4, 5)
+# Latencies kept per generation and command
+LATENCY_SAMPLES = 50
+# Latencies needed before the measured percentiles replace the default schedule
+MIN_LATENCY_SAMPLES = 5
+# Confirmation polls per command, the first at the 10th percentile latency, the last at the 95th
+CONFIRMATION_POLLS = 5
+# Percentile of the first poll, low enough that faster confirmations than usual are still measured
+FIRST_POLL_PERCENTILE = 10
+
+
+class CommandLatencyTracker:
+    """Keeps the recent confirmation latencies of remote commands per vehicle generation and command."""
+
+    def __init__(self) -> None:
+        self._samples: dict[tuple[ApiVehicleGeneration, RemoteRequestCommand], deque] = {}
+
+    def record(self, generation: ApiVehicleGeneration, command: RemoteRequestCommand, latency: float) -> None:
+        """Record the seconds between sending a command and the vehicle reporting its outcome."""
+        samples = self._samples.setdefault((generation, command), deque(maxlen=LATENCY_SAMPLES))
+        samples.append(latency)
+
+    def samples(self, generation: ApiVehicleGeneration, command: RemoteRequestCommand) -> int:
+        return len(self._samples.get((generation, command), ()))
+
+    def percentile(
+        self, generation: ApiVehicleGeneration, command: RemoteRequestCommand, percent: float
+    ) -> Optional[float]:
+        """Return a percentile of the recorded latencies (nearest rank), None without samples."""
+        samples = self._samples.get((generation, command))
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+    def confirmation_schedule(
+        self, generation: ApiVehicleGeneration, command: RemoteRequestCommand
+    ) -> tuple[float, ...]:
+        """Return when to poll for the outcome of a command, in seconds after it was sent.
+
+        The first poll is at the 10th percentile latency, so confirmations
+        faster than the median are still measured and the schedule can adapt
+        downwards as well. The following ones back off, doubling the gap each
+        time, to end at the 95th percentile.
+        """
+        if self.samples(generation, command) < MIN_LATENCY_SAMPLES:
+            return DEFAULT_CONFIRMATION_SCHEDULE
+
+        first = self.percentile(generation, command, FIRST_POLL_PERCENTILE)
+        p95 = self.percentile(generation, command, 95)
+        if p95 <= first:
+            return (first,)
+
+        gap = (p95 - first) / (2 ** (CONFIRMATION_POLLS - 1) - 1)
+        schedule = [first]
+        for i in range(CONFIRMATION_POLLS - 1):
+            schedule.append(schedule[-1] + gap * 2**i)
+        return tuple(schedule)
+
+    def as_dict(self) -> list:
+        return [
+            {
+                "generation": generation.value,
+                "command": command.name,
+                "samples": len(samples),
+                "p50": self.percentile(generation, command, 50),
+                "p95": self.percentile(generation, command, 95),
+            }
+            for (generation, command), samples in self._samples.items()
+        ]
@@ -1,11 +1,8 @@
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Optional
 
-from toyota_na.vehicle.base_vehicle import ToyotaVehicle, VehicleFeatures
-from toyota_na.vehicle.entity_types.ToyotaLockableOpening import ToyotaLockableOpening
-from toyota_na.vehicle.entity_types.ToyotaOpening import ToyotaOpening
-from toyota_na.vehicle.entity_types.ToyotaRemoteStart import ToyotaRemoteStart
+from toyota_na.vehicle.base_vehicle import VehicleFeatures
 
 
 from homeassistant.components.lock import (
@@ -15,18 +12,15 @@ from homeassistant.components.lock import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .base_entity import ToyotaNABaseEntity
+from .coordinator import ToyotaVehicleCoordinator
+from .latency import CommandLatencyTracker
+from .wake_budget import WakeBudget
 from .const import COMMAND_MAP, DOMAIN, DOOR_LOCK, DOOR_UNLOCK
 
 _LOGGER = logging.getLogger(__name__)
 
-# Constants for command timing
-COMMAND_INITIAL_WAIT = 1  # Wait 1 second after sending command before first poll
-COMMAND_POLL_INTERVAL = 1  # Poll every 1 second
-COMMAND_MAX_POLLS = 5     # Poll up to 5 times (total 5 seconds)
-
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -35,22 +29,29 @@ async def async_setup_entry(
     """Set up the binary_sensor platform."""
     locks = []
 
-    coordinator: DataUpdateCoordinator[list[ToyotaVehicle]] = hass.data[DOMAIN][
+    vehicle_coordinators: dict[str, ToyotaVehicleCoordinator] = hass.data[DOMAIN][
         config_entry.entry_id
-    ]["coordinator"]
+    ]["vehicle_coordinators"]
+    command_latencies: CommandLatencyTracker = hass.data[DOMAIN][config_entry.entry_id][
+        "command_latencies"
+    ]
+    wake_budget: WakeBudget = hass.data[DOMAIN][config_entry.entry_id]["wake_budget"]
 
-    for vehicle in coordinator.data:
+    for coordinator in vehicle_coordinators.values():
+        vehicle = coordinator.vehicle
         if vehicle.subscribed is False:
             continue
         locks.append(
             ToyotaLock(
+                command_latencies,
+                wake_budget,
                 coordinator,
                 "",
                 vehicle.vin,
             )
         )
 
-    async_add_devices(locks, True)
+    async_add_devices(locks)
 
 
 class ToyotaLock(ToyotaNABaseEntity, LockEntity):
@@ -61,19 +62,36 @@ class ToyotaLock(ToyotaNABaseEntity, LockEntity):
     _last_lock_state = None  # Track the last known lock state
     _force_state = None  # Force a specific state after a command
     _force_state_expiry = 0  # When to stop forcing the state
+    _command_id = 0  # Incremented by every lock/unlock
 
     def __init__(
         self,
+        command_latencies: CommandLatencyTracker,
+        wake_budget: WakeBudget,
         coordinator,
         *args: Any,
     ):
         super().__init__(coordinator, *args)
+        self._command_latencies = command_latencies
+        self._wake_budget = wake_budget
         self._state_changing = False
         self._target_state = None
         self._command_progress = 0
         self._last_lock_state = None
         self._force_state = None
         self._force_state_expiry = 0
+        self._command_id = 0
+
+    def _features_changed(self) -> bool:
+        if self.vehicle is None:
+            return True
+        lockable_openings = self.vehicle.lockable_openings
+        return any(
+            feature == VehicleFeatures.LastTimeStamp
+            or feature not in self.vehicle.features
+            or feature in lockable_openings
+            for feature in self.vehicle.changed_features
+        )
 
     @property
     def icon(self):
@@ -103,44 +121,29 @@ class ToyotaLock(ToyotaNABaseEntity, LockEntity):
             return self._target_state
             
         _is_locked = False  # Default to unlocked if we can't determine
-        lock_states = {}
 
         if self.vehicle is not None:
-            # Get all lockable openings from the vehicle
-            all_locks = [
-                feature
-                for feature in self.vehicle.features.values()
-                if isinstance(feature, ToyotaLockableOpening)
-            ]
-            
+            summary = self.vehicle.lock_summary
+
             # If no locks are found, return the last known state or default to False
-            if not all_locks:
+            if summary is None:
                 _LOGGER.debug(f"No lock features found for vehicle {self.vin}, using last known state: {self._last_lock_state}")
                 return self._last_lock_state if self._last_lock_state is not None else False
-            
-            # Check if any lock is locked - if ANY lock is locked, consider the vehicle locked
+
+            # If ANY lock is locked, consider the vehicle locked
             # This matches Toyota app behavior
-            for lock in all_locks:
-                # Store the lock state for logging
-                if hasattr(lock, 'name'):
-                    lock_name = lock.name
-                else:
-                    lock_name = "Unknown"
-                
-                # Get the actual lock state
-                if hasattr(lock, 'locked'):
-                    lock_states[lock_name] = lock.locked
-                    if lock.locked is True:
-                        _is_locked = True
-                else:
-                    lock_states[lock_name] = None
+            _is_locked = summary.locked
+
+            # Log detailed lock state information at debug level
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                lock_states = {
+                    feature.name: opening.locked
+                    for feature, opening in self.vehicle.lockable_openings.items()
+                }
+                _LOGGER.debug(f"Vehicle {self.vin} lock states: {lock_states}, overall state: {_is_locked}")
         else:
             _LOGGER.debug(f"Vehicle {self.vin} not found in coordinator data")
         
-        # Log detailed lock state information at debug level
-        if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug(f"Vehicle {self.vin} lock states: {lock_states}, overall state: {_is_locked}")
-        
         # Store the current state for future reference
         self._last_lock_state = _is_locked
         
@@ -193,10 +196,14 @@ class ToyotaLock(ToyotaNABaseEntity, LockEntity):
     async def toggle_lock(self, command: str):
         """Set the lock state via the provided command string."""
         if self.vehicle is not None:
+            # A later lock/unlock supersedes this one, only the latest updates the entity state
+            self._command_id += 1
+            command_id = self._command_id
+            target_state = command == DOOR_LOCK
             try:
                 # Set state changing flag and target state
                 self._state_changing = True
-                self._target_state = (command == DOOR_LOCK)
+                self._target_state = target_state
                 self._command_progress = 10  # Starting progress
                 
                 # Force the state to match what we expect after the command
@@ -209,72 +216,14 @@ class ToyotaLock(ToyotaNABaseEntity, LockEntity):
                 
                 _LOGGER.info(f"Starting {command} command for vehicle {self.vehicle.vin}")
                 
-                # Send the command to this specific vehicle
-                await self.vehicle.send_command(COMMAND_MAP[command])
-                self._command_progress = 30
-                self.async_write_ha_state()
-                
-                # Poll for vehicle refresh in background
-                await self.vehicle.poll_vehicle_refresh()
-                self._command_progress = 50
-                self.async_write_ha_state()
-                
-                # Wait a short time for the command to take effect
-                await asyncio.sleep(COMMAND_INITIAL_WAIT)
-                
-                # Poll the vehicle state at regular intervals
-                success = False
-                for i in range(COMMAND_MAX_POLLS):
-                    try:
-                        # Update progress indicator
-                        self._command_progress = 50 + ((i + 1) * 10)
-                        self.async_write_ha_state()
-                        
-                        # Try to update the vehicle state
-                        await self.vehicle.update()
-                        
-                        # Check if the state matches what we expect
-                        # For this check, bypass the forced state
-                        self._force_state = None  # Temporarily disable forced state
-                        current_locked = self.is_locked
-                        self._force_state = self._target_state  # Restore forced state
-                        expected_state = self._target_state
-                        
-                        _LOGGER.debug(f"Poll {i+1}: Current state: {current_locked}, Expected: {expected_state}")
-                        
-                        if current_locked == expected_state:
-                            _LOGGER.info(f"Vehicle {self.vehicle.vin} {command} command successful")
-                            success = True
-                            break
-                            
-                        await asyncio.sleep(COMMAND_POLL_INTERVAL)
-                    except Exception as e:
-                        _LOGGER.debug(f"Poll {i+1} failed during {command}: {str(e)}")
-                        await asyncio.sleep(COMMAND_POLL_INTERVAL)
-                
-                # Set progress to 100% regardless of outcome
-                self._command_progress = 100
-                self.async_write_ha_state()
-                
-                if not success:
-                    # Force one more update with a longer timeout
-                    try:
-                        _LOGGER.warning(f"Vehicle {self.vehicle.vin} {command} command may not have completed successfully, forcing final update")
-                        await self.vehicle.poll_vehicle_refresh()
-                        await asyncio.sleep(2)  # Wait a bit longer for the final update
-                        await self.vehicle.update()
-                        
-                        # Check state one more time
-                        self._force_state = None  # Temporarily disable forced state
-                        current_locked = self.is_locked
-                        self._force_state = self._target_state  # Restore forced state
-                        expected_state = self._target_state
-                        
-                        if current_locked == expected_state:
-                            _LOGGER.info(f"Vehicle {self.vehicle.vin} {command} command successful after final check")
-                            success = True
-                    except Exception as e:
-                        _LOGGER.error(f"Final update failed after {command}: {str(e)}")
+                # Commands of a vehicle are serialized, superseded ones stop being confirmed
+                success = await self.coordinator.command_queue.async_submit(
+                    COMMAND_MAP[command],
+                    lambda: self._async_confirm_lock(command, target_state),
+                )
+                if command_id != self._command_id:
+                    _LOGGER.debug(f"Vehicle {self.vin} {command} command superseded")
+                    return
                 
                 # Reset state changing flags but keep the forced state for a bit longer
                 self._state_changing = False
@@ -284,16 +233,21 @@ class ToyotaLock(ToyotaNABaseEntity, LockEntity):
                 # If successful, keep the forced state for 10 more seconds
                 # If not successful, clear the forced state
                 if success:
-                    self._force_state = expected_state
+                    self._force_state = target_state
                     self._force_state_expiry = asyncio.get_event_loop().time() + 10
                 else:
                     self._force_state = None
                 
+                # Let the other entities of the vehicle (doors, ...) pick up the confirmed status
+                self.coordinator.async_set_updated_data(self.vehicle)
+
                 # Force a final update of this entity
                 self.async_write_ha_state()
                 
             except Exception as e:
                 _LOGGER.error(f"Error sending {command} command to vehicle {self.vehicle.vin}: {str(e)}")
+                if command_id != self._command_id:
+                    return
                 # Reset all state flags
                 self._state_changing = False
                 self._target_state = None
@@ -302,6 +256,85 @@ class ToyotaLock(ToyotaNABaseEntity, LockEntity):
                 # Force an update of this entity only
                 self.async_write_ha_state()
 
+    async def _async_confirm_lock(self, command: str, expected_state: bool) -> bool:
+        """Poll the vehicle until it reports the expected lock state, once the command was sent."""
+        loop = asyncio.get_running_loop()
+        sent_at = loop.time()
+
+        self._command_progress = 30
+        self.async_write_ha_state()
+        
+        # Poll for vehicle refresh in background
+        await self._async_wake_vehicle()
+        self._command_progress = 50
+        self.async_write_ha_state()
+        
+        # Poll when the vehicle usually reports the outcome, from the latencies measured so far
+        remote_command = COMMAND_MAP[command]
+        schedule = self._command_latencies.confirmation_schedule(self.vehicle.generation, remote_command)
+        
+        success = False
+        for i, delay in enumerate(schedule):
+            await asyncio.sleep(max(sent_at + delay - loop.time(), 0))
+            try:
+                # Update progress indicator
+                self._command_progress = 50 + ((i + 1) * 50 // (len(schedule) + 1))
+                self.async_write_ha_state()
+                
+                # Only fetch the status section reporting the locks
+                fetched = await self.vehicle.update_command_state(remote_command)
+                
+                # Check if the fetched state matches what we expect, not the optimistic one shown meanwhile
+                # A failed fetch leaves the previous state, which mustn't confirm the command
+                current_locked = self._fetched_lock_state() if fetched else None
+                
+                _LOGGER.debug(f"Poll {i+1}: Current state: {current_locked}, Expected: {expected_state}")
+                
+                if current_locked == expected_state:
+                    _LOGGER.info(f"Vehicle {self.vehicle.vin} {command} command successful")
+                    self._command_latencies.record(self.vehicle.generation, remote_command, loop.time() - sent_at)
+                    success = True
+                    break
+            except Exception as e:
+                _LOGGER.debug(f"Poll {i+1} failed during {command}: {str(e)}")
+        
+        # Set progress to 100% regardless of outcome
+        self._command_progress = 100
+        self.async_write_ha_state()
+        
+        if not success:
+            # Force one more update with a longer timeout
+            try:
+                _LOGGER.warning(f"Vehicle {self.vehicle.vin} {command} command may not have completed successfully, forcing final update")
+                await self._async_wake_vehicle()
+                await asyncio.sleep(2)  # Wait a bit longer for the final update
+                fetched = await self.vehicle.update_command_state(remote_command)
+                
+                # Check state one more time
+                current_locked = self._fetched_lock_state() if fetched else None
+                
+                if current_locked == expected_state:
+                    # Not recorded, the latency includes the extra wake-up and delay of this check
+                    _LOGGER.info(f"Vehicle {self.vehicle.vin} {command} command successful after final check")
+                    success = True
+            except Exception as e:
+                _LOGGER.error(f"Final update failed after {command}: {str(e)}")
+        
+        return success
+
+    def _fetched_lock_state(self) -> Optional[bool]:
+        """Return the lock state last reported by the vehicle, or None if it reports no locks."""
+        summary = self.vehicle.lock_summary
+        return summary.locked if summary is not None else None
+
+    async def _async_wake_vehicle(self) -> None:
+        """Wake up the vehicle to report the outcome of a command, if its wake-up budget allows."""
+        if not self._wake_budget.allow_user(self.vehicle.vin):
+            _LOGGER.debug(f"Wake-up budget of vehicle {self.vehicle.vin} doesn't allow a wake-up, confirming without it")
+            return
+        self._wake_budget.record(self.vehicle.vin)
+        await self.vehicle.poll_vehicle_refresh()
+
     @property
     def available(self):
         return self.vehicle is not None
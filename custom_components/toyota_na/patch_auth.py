@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 import json
 import logging
 import aiohttp
@@ -7,10 +8,33 @@ from toyota_na import ToyotaOneAuth
 from toyota_na.exceptions import LoginError
 
 
+@asynccontextmanager
+async def _auth_session(self):
+    """Use the pooled session of the config entry when there is one, a short-lived session otherwise.
+
+    The pooled session's cookie jar keeps the login servers' cookies between logins.
+    """
+    session = getattr(self, "session", None)
+    if session is not None and not session.closed:
+        yield session
+    else:
+        async with aiohttp.ClientSession() as session:
+            yield session
+
+
 async def authorize(self, username, password, otp=None):
-    async with aiohttp.ClientSession() as session:
+    async with _auth_session(self) as session:
         headers = {"Accept-API-Version": "resource=2.1, protocol=1.0"}
 
+        sso_token = getattr(self, "sso_token", None)
+        if otp is None and sso_token is not None:
+            # A still valid SSO session only needs a new authorization code
+            try:
+                return await _request_authorization_code(session, headers, sso_token)
+            except LoginError:
+                logging.debug("SSO session expired, authenticating again")
+                self.sso_token = None
+
         data = {}
         otp_brake = False
         if otp is not None:    # Retrieve callbacks if we have the otp code
@@ -50,26 +74,62 @@ async def authorize(self, username, password, otp=None):
         if "tokenId" not in data:
             logging.error(json.dumps(data))
             raise LoginError()
-        headers["Cookie"] = f"iPlanetDirectoryPro={data['tokenId']}"
-        auth_params = {
-            "client_id": "oneappsdkclient",
-            "scope": "openid profile write",
-            "response_type": "code",
-            "redirect_uri": "com.toyota.oneapp:/oauth2Callback",
-            "code_challenge": "plain",
-            "code_challenge_method": "plain"
-        }
-        AUTHORIZE_URL_QS = f"{ToyotaOneAuth.AUTHORIZE_URL}?{urlencode(auth_params)}"
-        async with session.get(AUTHORIZE_URL_QS, headers=headers, allow_redirects=False) as resp:
-            if resp.status != 302:
-                logging.error(resp.text())
-                raise LoginError()
-            redir = resp.headers["Location"]
-            query = parse_qs(urlparse(redir).query)
-            if "code" not in query:
-                logging.error(redir)
+        # Kept for the next login of this account
+        self.sso_token = data["tokenId"]
+        return await _request_authorization_code(session, headers, data["tokenId"])
+
+
+async def _request_authorization_code(session, headers, sso_token):
+    headers = {**headers, "Cookie": f"iPlanetDirectoryPro={sso_token}"}
+    auth_params = {
+        "client_id": "oneappsdkclient",
+        "scope": "openid profile write",
+        "response_type": "code",
+        "redirect_uri": "com.toyota.oneapp:/oauth2Callback",
+        "code_challenge": "plain",
+        "code_challenge_method": "plain"
+    }
+    AUTHORIZE_URL_QS = f"{ToyotaOneAuth.AUTHORIZE_URL}?{urlencode(auth_params)}"
+    async with session.get(AUTHORIZE_URL_QS, headers=headers, allow_redirects=False) as resp:
+        if resp.status != 302:
+            logging.error(await resp.text())
+            raise LoginError()
+        redir = resp.headers["Location"]
+        query = parse_qs(urlparse(redir).query)
+        if "code" not in query:
+            # An expired SSO session is redirected to the login page
+            logging.debug(redir)
+            raise LoginError()
+        return query["code"][0]
+
+
+async def _request_access_token(self, data):
+    async with _auth_session(self) as session:
+        async with session.post(ToyotaOneAuth.ACCESS_TOKEN_URL, data=data) as resp:
+            if resp.status != 200:
                 raise LoginError()
-            return query["code"][0]
+            self._extract_tokens(await resp.json())
+
+
+async def refresh_tokens(self):
+    await _request_access_token(self, {
+        "client_id": "oneappsdkclient",
+        "redirect_uri": "com.toyota.oneapp:/oauth2Callback",
+        "grant_type": "refresh_token",
+        "code_verifier": "plain",
+        "refresh_token": self._refresh_token,
+    })
+
+
+async def request_tokens(self, code):
+    await _request_access_token(self, {
+        "client_id": "oneappsdkclient",
+        "redirect_uri": "com.toyota.oneapp:/oauth2Callback",
+        "grant_type": "authorization_code",
+        "code_verifier": "plain",
+        "code": code,
+    })
+
             
 async def login(self, username, password, otp):
     authorization_code = await self.authorize(username, password, otp)
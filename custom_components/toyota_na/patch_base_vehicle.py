@@ -1,14 +1,48 @@
 from abc import ABC, abstractmethod
+import asyncio
 from enum import Enum, auto, unique
-from typing import Union
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, NamedTuple, Optional, Union
+
+import aiohttp
 
 from toyota_na.client import ToyotaOneClient
+from toyota_na.exceptions import AuthError
 from toyota_na.vehicle.entity_types.ToyotaLocation import ToyotaLocation
 from toyota_na.vehicle.entity_types.ToyotaLockableOpening import ToyotaLockableOpening
 from toyota_na.vehicle.entity_types.ToyotaNumeric import ToyotaNumeric
 from toyota_na.vehicle.entity_types.ToyotaOpening import ToyotaOpening
 from toyota_na.vehicle.entity_types.ToyotaRemoteStart import ToyotaRemoteStart
 
+from homeassistant.exceptions import ConfigEntryAuthFailed
+
+from .breaker import BreakerState, CircuitBreaker
+
+if TYPE_CHECKING:
+    from .capabilities import EndpointCapabilities
+
+_LOGGER = logging.getLogger(__name__)
+
+# Maximum number of endpoint requests a single vehicle update keeps in flight
+MAX_CONCURRENT_ENDPOINT_FETCHES = 4
+# Response statuses meaning the endpoint isn't available for the vehicle
+UNSUPPORTED_ENDPOINT_STATUSES = (400, 404)
+# Statuses of requests rejected for their credentials, even after the client refreshed its tokens
+AUTH_ERROR_STATUSES = (401, 403)
+
+
+def is_auth_error(error: Exception) -> bool:
+    """Return True if a request failed because of the account's credentials rather than the endpoint."""
+    if isinstance(error, (AuthError, ConfigEntryAuthFailed)):
+        return True
+    return isinstance(error, aiohttp.ClientResponseError) and error.status in AUTH_ERROR_STATUSES
+
+
+def _feature_state(feature: Any) -> tuple:
+    """Return a comparable copy of the state of a feature, feature objects don't implement equality."""
+    return (type(feature), dict(vars(feature)))
+
+
 @unique
 class ApiVehicleGeneration(Enum):
     CY17 = "17CY"
@@ -71,6 +105,14 @@ class VehicleFeatures(Enum):
     ParkingLocation = auto()
 
 
+@unique
+class VehicleEndpoint(Enum):
+    Telemetry = "telemetry"
+    VehicleStatus = "vehicle_status"
+    EngineStatus = "engine_status"
+    ElectricStatus = "electric_status"
+
+
 @unique
 class RemoteRequestCommand(Enum):
     DoorLock = auto()
@@ -82,6 +124,29 @@ class RemoteRequestCommand(Enum):
     Refresh = auto()
 
 
+# Endpoint reporting the outcome of each remote command, fetched alone to confirm the command landed
+COMMAND_CONFIRMATION_ENDPOINTS: dict[RemoteRequestCommand, Optional[VehicleEndpoint]] = {
+    RemoteRequestCommand.DoorLock: VehicleEndpoint.VehicleStatus,
+    RemoteRequestCommand.DoorUnlock: VehicleEndpoint.VehicleStatus,
+    RemoteRequestCommand.EngineStart: VehicleEndpoint.EngineStatus,
+    RemoteRequestCommand.EngineStop: VehicleEndpoint.EngineStatus,
+    # The hazard lights state isn't reported by any endpoint
+    RemoteRequestCommand.HazardsOn: None,
+    RemoteRequestCommand.HazardsOff: None,
+    RemoteRequestCommand.Refresh: VehicleEndpoint.Telemetry,
+}
+
+
+class LockSummary(NamedTuple):
+    """Aggregate state of the lockable openings of a vehicle."""
+
+    # Like the Toyota app, the vehicle is considered locked if any opening is locked
+    locked: bool
+    all_locked: bool
+    all_closed: bool
+    openings: int
+
+
 class ToyotaVehicle(ABC):
     """Vehicle control and metadata object."""
 
@@ -102,6 +167,14 @@ class ToyotaVehicle(ABC):
     _model_year: str
     _generation: ApiVehicleGeneration
     _vin: str
+    _endpoint_errors: dict[VehicleEndpoint, Exception]
+    _fetched_endpoints: set[VehicleEndpoint]
+    _breakers: dict[VehicleEndpoint, CircuitBreaker]
+    _changed_features: set[VehicleFeatures]
+    _lockable_openings: dict[VehicleFeatures, ToyotaLockableOpening]
+    _lock_summary: Optional[LockSummary]
+    # Shared map of the endpoints each vehicle of the account supports, if any
+    capabilities: Optional["EndpointCapabilities"] = None
 
     def __init__(
         self,
@@ -127,6 +200,13 @@ class ToyotaVehicle(ABC):
         self._model_name = model_name
         self._model_year = model_year
         self._vin = vin
+        self._endpoint_errors = {}
+        self._fetched_endpoints = set()
+        self._breakers = {}
+        self._stale = False
+        self._changed_features = set()
+        self._lockable_openings = {}
+        self._lock_summary = None
 
     @abstractmethod
     async def poll_vehicle_refresh(self) -> None:
@@ -134,15 +214,174 @@ class ToyotaVehicle(ABC):
         pass
 
     @abstractmethod
-    async def send_command(self, command: RemoteRequestCommand) -> None:
-        """Start the engine. Periodically refreshes the vehicle status to determine if the engine is running."""
+    async def send_command(self, command: RemoteRequestCommand) -> bool:
+        """Send a remote command to the vehicle. Returns False if it couldn't be sent."""
         pass
 
     @abstractmethod
-    async def update(self):
-        """Calls the required Toyota APIs and instantiates all the attributes."""
+    async def update(self, endpoints: Optional[Iterable[VehicleEndpoint]] = None):
+        """Calls the required Toyota APIs and instantiates all the attributes. Restricted to `endpoints` when given."""
         pass
 
+    async def update_command_state(self, command: RemoteRequestCommand) -> bool:
+        """Fetch only the endpoint that reports the outcome of a remote command, return whether it was fetched."""
+        endpoint = COMMAND_CONFIRMATION_ENDPOINTS.get(command)
+        if endpoint is None:
+            return False
+        await self.update({endpoint})
+        return endpoint in self._fetched_endpoints and endpoint not in self._endpoint_errors
+
+    async def _update_endpoints(
+        self,
+        fetchers: dict[VehicleEndpoint, Callable[[], Awaitable[Any]]],
+        endpoints: Optional[Iterable[VehicleEndpoint]] = None,
+    ) -> None:
+        """Run the endpoint fetches concurrently. A failing endpoint is logged and doesn't affect the others.
+
+        Fetchers return the payload they parsed, or None if the endpoint returned no usable data.
+        """
+        if endpoints is not None:
+            endpoints = set(endpoints)
+            fetchers = {endpoint: fetcher for endpoint, fetcher in fetchers.items() if endpoint in endpoints}
+
+        if self.capabilities is not None:
+            fetchers = {
+                endpoint: fetcher
+                for endpoint, fetcher in fetchers.items()
+                if not self.capabilities.is_unsupported(self._vin, endpoint)
+            }
+
+        # Skip endpoints that keep failing until their breaker lets a probe through
+        for endpoint in list(fetchers):
+            if not self._breaker(endpoint).allow():
+                _LOGGER.debug(f"Skipping {endpoint.value} for vehicle {self._vin}, circuit breaker is open")
+                del fetchers[endpoint]
+
+        previous_states = {feature: _feature_state(value) for feature, value in self._features.items()}
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ENDPOINT_FETCHES)
+        errors: dict[VehicleEndpoint, Exception] = {}
+
+        async def _fetch(endpoint: VehicleEndpoint, fetcher: Callable[[], Awaitable[Any]]) -> None:
+            try:
+                async with semaphore:
+                    try:
+                        payload = await fetcher()
+                    except Exception as e:
+                        errors[endpoint] = e
+                        self._log_endpoint_error(endpoint, e)
+                        if (
+                            self.capabilities is not None
+                            and isinstance(e, aiohttp.ClientResponseError)
+                            and e.status in UNSUPPORTED_ENDPOINT_STATUSES
+                        ):
+                            self.capabilities.record(self._vin, endpoint, None)
+                        # Authentication and throttling problems aren't the endpoint's fault
+                        if not is_auth_error(e) and not (
+                            isinstance(e, aiohttp.ClientResponseError) and e.status == 429
+                        ):
+                            self._record_endpoint_failure(endpoint)
+                    else:
+                        self._breaker(endpoint).record_success()
+                        if self.capabilities is not None:
+                            self.capabilities.record(self._vin, endpoint, payload)
+            finally:
+                # A probe ending without a verdict, cancellation included, must not keep the breaker half-open
+                self._breaker(endpoint).release()
+
+        await asyncio.gather(
+            *(_fetch(endpoint, fetcher) for endpoint, fetcher in fetchers.items())
+        )
+        self._fetched_endpoints = set(fetchers)
+        self._endpoint_errors = errors
+        self._changed_features.update(
+            feature
+            for feature in previous_states.keys() | self._features.keys()
+            if feature not in self._features
+            or previous_states.get(feature) != _feature_state(self._features[feature])
+        )
+        if len(errors) < len(fetchers):
+            self._stale = False
+
+    def _log_endpoint_error(self, endpoint: VehicleEndpoint, error: Exception) -> None:
+        if isinstance(error, aiohttp.ClientResponseError) and error.status == 400:
+            _LOGGER.warning(
+                f"{endpoint.value} endpoint returned 400 Bad Request for vehicle {self._vin}. This may be due to API changes or subscription limitations. Skipping {endpoint.value} update."
+            )
+        else:
+            _LOGGER.error(f"Error getting {endpoint.value} for vehicle {self._vin}: {error}")
+
+    def _breaker(self, endpoint: VehicleEndpoint) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker()
+        return breaker
+
+    def _record_endpoint_failure(self, endpoint: VehicleEndpoint) -> None:
+        breaker = self._breaker(endpoint)
+        was_open = breaker.state is not BreakerState.Closed
+        breaker.record_failure()
+        if breaker.state is BreakerState.Open and not was_open:
+            _LOGGER.warning(f"{endpoint.value} keeps failing for vehicle {self._vin}, skipping it for a while")
+
+    def refresh_lock_summary(self) -> None:
+        """Rebuild the index of lockable openings and their summary, called whenever openings were parsed."""
+        self._lockable_openings = {
+            feature: value
+            for feature, value in self._features.items()
+            if isinstance(value, ToyotaLockableOpening)
+        }
+        openings = self._lockable_openings.values()
+        if not openings:
+            self._lock_summary = None
+            return
+        self._lock_summary = LockSummary(
+            locked=any(opening.locked for opening in openings),
+            all_locked=all(opening.locked for opening in openings),
+            all_closed=all(opening.closed for opening in openings),
+            openings=len(openings),
+        )
+
+    @property
+    def lockable_openings(self) -> dict[VehicleFeatures, ToyotaLockableOpening]:
+        return self._lockable_openings
+
+    @property
+    def lock_summary(self) -> Optional[LockSummary]:
+        """Aggregate state of the lockable openings, None if the vehicle reported none."""
+        return self._lock_summary
+
+    def mark_stale(self) -> None:
+        """Flag the features as not coming from the API, e.g. restored from storage, until the next successful update."""
+        self._stale = True
+
+    @property
+    def stale(self) -> bool:
+        return self._stale
+
+    @property
+    def changed_features(self) -> set[VehicleFeatures]:
+        """Features whose state changed since `clear_changed_features` was last called."""
+        return self._changed_features
+
+    def clear_changed_features(self) -> None:
+        self._changed_features = set()
+
+    @property
+    def endpoint_breakers(self) -> dict[VehicleEndpoint, CircuitBreaker]:
+        """Circuit breakers of the endpoints called so far."""
+        return self._breakers
+
+    @property
+    def endpoint_errors(self) -> dict[VehicleEndpoint, Exception]:
+        """Errors raised by the endpoints fetched during the last update."""
+        return self._endpoint_errors
+
+    @property
+    def fetched_endpoints(self) -> set[VehicleEndpoint]:
+        """Endpoints fetched during the last update."""
+        return self._fetched_endpoints
+
     @property
     def features(
         self,
@@ -1,10 +1,60 @@
+import asyncio
+from contextlib import nullcontext
+from functools import partial
 import logging
 from urllib.parse import urljoin
 
 import aiohttp
 
+from toyota_na.auth import ToyotaOneAuth
+
+from .cache import response_cache_key
+from .ratelimit import RATE_LIMIT_MAX_RETRIES, throttle_delay
+
 API_GATEWAY = "https://oneapi-east.telematicsct.com/"
 
+# Connection pool settings for the per-entry session
+HTTP_CONNECTION_LIMIT = 20
+HTTP_CONNECTION_LIMIT_PER_HOST = 6
+HTTP_DNS_CACHE_TTL = 300  # 5 minutes
+HTTP_KEEPALIVE_TIMEOUT = 120  # 2 minutes
+HTTP_REQUEST_TIMEOUT = 30
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a pooled, keep-alive session for talking to the Toyota API and its login servers.
+
+    Its cookie jar lives as long as the config entry, so re-logins keep the login servers' cookies.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.CookieJar(),
+        timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT),
+    )
+
+
+def __init__(self, auth=None, session=None, cache=None, rate_limiter=None, governor=None, token_manager=None) -> None:
+    self.auth = auth or ToyotaOneAuth()
+    # Long-lived session owned by the config entry. Clients created without one
+    # (e.g. during the config flow) fall back to a short-lived session per request.
+    self.session = session
+    # Optional TokenBucket pacing every call of the account
+    self.rate_limiter = rate_limiter
+    # Optional TokenManager keeping the tokens fresh, requests don't refresh them inline
+    self.token_manager = token_manager
+    # Optional ConcurrencyGovernor bounding the requests in flight across every account
+    self.governor = governor
+    # Optional ResponseCache serving recent GET responses without a network trip
+    self.cache = cache
+    # In-flight GET requests, shared by concurrent callers asking for the same data
+    self._inflight_gets = {}
+
 async def get_electric_status(self, vin):
     electric_status = await self.api_get(
         "v2/electric/status", {"VIN": vin}
@@ -12,19 +62,88 @@ async def get_electric_status(self, vin):
     if "vehicleInfo" in electric_status:
         return electric_status
 
+async def api_get(self, endpoint, header_params=None):
+    """GET an endpoint. Concurrent identical requests share one in-flight request and its result."""
+    if self.cache is not None:
+        hit, payload = self.cache.get(response_cache_key(endpoint, header_params))
+        if hit:
+            return payload
+
+    key = (endpoint, frozenset((header_params or {}).items()))
+    future = self._inflight_gets.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_get_and_cache(self, endpoint, header_params))
+        self._inflight_gets[key] = future
+        future.add_done_callback(partial(_forget_inflight_get, self._inflight_gets, key))
+    else:
+        logging.debug("Joining in-flight request for %s", endpoint)
+    # A caller being cancelled must not cancel the request for the other callers
+    return await asyncio.shield(future)
+
+async def _get_and_cache(self, endpoint, header_params):
+    payload = await self.api_request("GET", endpoint, header_params)
+    if self.cache is not None:
+        self.cache.set(response_cache_key(endpoint, header_params), payload)
+    return payload
+
+async def api_post(self, endpoint, json, header_params=None):
+    try:
+        return await self.api_request("POST", endpoint, header_params, json=json)
+    finally:
+        # Commands and refresh requests change what the vehicle reports
+        if self.cache is not None:
+            self.cache.invalidate((header_params or {}).get("VIN"))
+
+def _forget_inflight_get(inflight_gets, key, future):
+    inflight_gets.pop(key, None)
+    if not future.cancelled():
+        # Mark the exception as retrieved, callers that are still waiting get it through the shield
+        future.exception()
+
 async def api_request(self, method, endpoint, header_params=None, **kwargs):
-    headers = await self._auth_headers()
-    if header_params:
-        headers.update(header_params)
-
-    async with aiohttp.ClientSession() as session:
-        async with session.request(
-                method, urljoin(API_GATEWAY, endpoint), headers=headers, **kwargs
-        ) as resp:
-            resp.raise_for_status()
-            try:
-                resp_json = await resp.json()
-                return resp_json["payload"]
-            except:
-                logging.error("Error parsing response: %s", await resp.text())
-                raise
\ No newline at end of file
+    token_refreshed = False
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+        if self.token_manager is not None:
+            await self.token_manager.async_ensure_valid()
+        headers = await self._auth_headers()
+        if header_params:
+            headers.update(header_params)
+
+        try:
+            async with self.governor.slot() if self.governor is not None else nullcontext():
+                if self.session is None or self.session.closed:
+                    async with aiohttp.ClientSession() as session:
+                        return await _send_request(session, method, endpoint, headers, **kwargs)
+
+                return await _send_request(self.session, method, endpoint, headers, **kwargs)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 401 and self.token_manager is not None and not token_refreshed and attempt < RATE_LIMIT_MAX_RETRIES:
+                # Retry once with fresh tokens, concurrent rejected requests share the refresh
+                token_refreshed = True
+                logging.warning("Toyota API rejected the access token for %s %s, refreshing it", method, endpoint)
+                await self.token_manager.async_handle_unauthorized(headers["AUTHORIZATION"].split(" ", 1)[-1])
+                continue
+            if e.status != 429 or attempt == RATE_LIMIT_MAX_RETRIES:
+                raise
+            delay = throttle_delay(e, attempt)
+            logging.warning("Toyota API throttled %s %s, retrying in %.1f seconds", method, endpoint, delay)
+            if self.rate_limiter is not None:
+                # Queued calls wait as well instead of being throttled too
+                self.rate_limiter.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+
+async def _send_request(session, method, endpoint, headers, **kwargs):
+    async with session.request(
+            method, urljoin(API_GATEWAY, endpoint), headers=headers, **kwargs
+    ) as resp:
+        resp.raise_for_status()
+        try:
+            resp_json = await resp.json()
+            return resp_json["payload"]
+        except:
+            logging.error("Error parsing response: %s", await resp.text())
+            raise
@@ -1,5 +1,7 @@
 import datetime
 import logging
+from typing import Iterable, Optional
+
 import aiohttp
 
 from toyota_na.client import ToyotaOneClient
@@ -15,6 +17,8 @@ from toyota_na.vehicle.entity_types.ToyotaNumeric import ToyotaNumeric
 from toyota_na.vehicle.entity_types.ToyotaOpening import ToyotaOpening
 from toyota_na.vehicle.entity_types.ToyotaRemoteStart import ToyotaRemoteStart
 
+from .patch_base_vehicle import VehicleEndpoint
+
 _LOGGER = logging.getLogger(__name__)
 
 class SeventeenCYPlusToyotaVehicle(ToyotaVehicle):
@@ -98,87 +102,64 @@ class SeventeenCYPlusToyotaVehicle(ToyotaVehicle):
         """Return whether the vehicle has a remote subscription."""
         return self._has_remote_subscription
 
-    async def update(self):
+    async def update(self, endpoints: Optional[Iterable[VehicleEndpoint]] = None):
+        """Fetch the endpoints supported by this vehicle concurrently, restricted to `endpoints` when given."""
+        # Always try to get telemetry for all vehicles, even unsubscribed ones
+        fetchers = {VehicleEndpoint.Telemetry: self._update_telemetry}
 
-        try:
-            # Always try to get telemetry for all vehicles, even unsubscribed ones
-            try:
-                telemetry = await self._client.get_telemetry(self._vin)
-                self._parse_telemetry(telemetry)
-            except Exception as e:
-                # Log the error but continue with other updates
-                logging.error(f"Error getting telemetry: {e}")
-                
-            if self._has_remote_subscription:
-                try:
-                    vehicle_status = await self._client.get_vehicle_status(self._vin)
-                    self._parse_vehicle_status(vehicle_status)
-                except Exception as e:
-                    # Log the error but continue with other updates
-                    logging.error(f"Error getting vehicle status: {e}")
-                
-                try:
-                    # Try to get engine status, but handle 400 errors gracefully
-                    engine_status = await self._client.get_engine_status(self._vin)
-                    self._parse_engine_status(engine_status)
-                except aiohttp.ClientResponseError as e:
-                    if e.status == 400:
-                        logging.warning(f"Engine status endpoint returned 400 Bad Request. This may be due to API changes or subscription limitations. Skipping engine status update.")
-                    else:
-                        logging.error(f"Error getting engine status: {e}")
-                except Exception as e:
-                    logging.error(f"Error getting engine status: {e}")
-            else:
-                logging.debug(f"Vehicle {self._model_year} {self._model_name} ({self.vin}) does not have an active remote subscription. Some updates skipped.")
-        except Exception as e:
-            _LOGGER.error(e)
-            pass
+        if self._has_remote_subscription:
+            fetchers[VehicleEndpoint.VehicleStatus] = self._update_vehicle_status
+            fetchers[VehicleEndpoint.EngineStatus] = self._update_engine_status
+        else:
+            logging.debug(f"Vehicle {self._model_year} {self._model_name} ({self.vin}) does not have an active remote subscription. Some updates skipped.")
 
-        try:
-            if self._has_electric:
-                # electric_status
-                electric_status = await self._client.get_electric_status(self.vin)
-                if electric_status is not None:
-                    self._parse_electric_status(electric_status)
-        except Exception as e:
-            _LOGGER.error(e)
-            pass
+        if self._has_electric:
+            fetchers[VehicleEndpoint.ElectricStatus] = self._update_electric_status
+
+        await self._update_endpoints(fetchers, endpoints)
+
+    async def _update_telemetry(self) -> dict:
+        telemetry = await self._client.get_telemetry(self._vin)
+        self._parse_telemetry(telemetry)
+        return telemetry
+
+    async def _update_vehicle_status(self) -> dict:
+        vehicle_status = await self._client.get_vehicle_status(self._vin)
+        self._parse_vehicle_status(vehicle_status)
+        return vehicle_status
+
+    async def _update_engine_status(self) -> dict:
+        engine_status = await self._client.get_engine_status(self._vin)
+        self._parse_engine_status(engine_status)
+        return engine_status
+
+    async def _update_electric_status(self) -> Optional[dict]:
+        electric_status = await self._client.get_electric_status(self.vin)
+        if electric_status is not None:
+            self._parse_electric_status(electric_status)
+        return electric_status
 
     async def poll_vehicle_refresh(self) -> None:
         """Instructs Toyota's systems to ping the vehicle to upload a fresh status. Useful when certain actions have been taken, such as locking or unlocking doors."""
         await self._client.send_refresh_status(self._vin)
 
-    async def send_command(self, command: RemoteRequestCommand) -> None:
-        """Send a remote command to the vehicle with robust error handling."""
+    async def send_command(self, command: RemoteRequestCommand) -> bool:
+        """Send a remote command to the vehicle with robust error handling. Returns False if it couldn't be sent."""
         try:
             await self._client.remote_request(self._vin, self._command_map[command])
             _LOGGER.info(f"Successfully sent command {command} to vehicle {self._vin}")
+            return True
         except aiohttp.ClientResponseError as e:
             _LOGGER.error(f"Error sending command {command} to vehicle {self._vin}: HTTP {e.status} - {e.message}")
             if e.status == 400:
                 _LOGGER.warning(f"Bad Request (400) when sending command. This may be due to API changes, subscription limitations, or vehicle state.")
             elif e.status == 401 or e.status == 403:
-                _LOGGER.warning(f"Authentication error ({e.status}) when sending command. Tokens may need to be refreshed.")
-                # Try to refresh tokens
-                try:
-                    # Use login instead of refresh_tokens which might be failing
-                    if hasattr(self._client.auth, 'username') and hasattr(self._client.auth, 'password'):
-                        await self._client.auth.login(self._client.auth.username, self._client.auth.password)
-                    else:
-                        await self._client.auth.refresh_tokens()
-                    _LOGGER.info("Successfully refreshed authentication tokens")
-                    # Try the command again after refreshing tokens
-                    try:
-                        await self._client.remote_request(self._vin, self._command_map[command])
-                        _LOGGER.info(f"Successfully sent command {command} to vehicle {self._vin} after token refresh")
-                    except Exception as retry_e:
-                        _LOGGER.error(f"Still failed to send command after token refresh: {retry_e}")
-                except Exception as auth_e:
-                    _LOGGER.error(f"Failed to refresh authentication tokens: {auth_e}")
-                    # Don't raise the exception to prevent integration disconnection
+                # The client already retried with refreshed tokens
+                _LOGGER.warning(f"Authentication error ({e.status}) when sending command, even with refreshed tokens.")
         except Exception as e:
             _LOGGER.error(f"Unexpected error sending command {command} to vehicle {self._vin}: {e}")
             # Don't raise the exception to prevent integration disconnection
+        return False
 
     #
     # engine_status
@@ -249,6 +230,8 @@ class SeventeenCYPlusToyotaVehicle(ToyotaVehicle):
                             locked=self._isLocked(section),
                         )
 
+        self.refresh_lock_summary()
+
     #
     # get_telemetry
     #
@@ -0,0 +1,106 @@
+"""Client-side pacing of Toyota API calls."""
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import logging
+import random
+import time
+from typing import Optional
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# Retries of a throttled (HTTP 429) request
+RATE_LIMIT_MAX_RETRIES = 3
+RATE_LIMIT_BACKOFF_BASE = 2  # seconds, doubled on every retry
+RATE_LIMIT_MAX_BACKOFF = 60
+
+
+class TokenBucket:
+    """Token-bucket limiter shared by every API call of an account.
+
+    Allows bursts of up to `burst` calls, then paces calls at `rate` per
+    second. When Toyota throttles us the whole bucket is paused, so queued
+    calls wait instead of being throttled as well.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self.acquired = 0
+        self.queued = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def acquire(self) -> float:
+        """Wait for a token. Returns the number of seconds the call was queued."""
+        started_at = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+
+                wait = max(self._paused_until - now, (1 - self._tokens) / self._rate, 0)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            self._tokens -= 1
+
+        waited = time.monotonic() - started_at
+        self.acquired += 1
+        if waited > 0.001:
+            self.queued += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            _LOGGER.debug(f"Toyota API call queued for {waited:.2f}s by the rate limiter")
+        return waited
+
+    def pause(self, delay: float) -> None:
+        """Hold every call for `delay` seconds after the server throttled us."""
+        self.throttled += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def as_dict(self) -> dict:
+        return {
+            "rate_per_minute": self._rate * 60,
+            "burst": self._burst,
+            "acquired": self.acquired,
+            "queued": self.queued,
+            "throttled": self.throttled,
+            "total_wait": round(self.total_wait, 3),
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+def throttle_delay(error: aiohttp.ClientResponseError, attempt: int) -> float:
+    """Return how long to wait before retrying a throttled request.
+
+    Honours the server's Retry-After header, otherwise backs off exponentially with jitter.
+    """
+    retry_after = _parse_retry_after(error.headers.get("Retry-After") if error.headers else None)
+    if retry_after is None:
+        retry_after = RATE_LIMIT_BACKOFF_BASE * 2 ** attempt * random.uniform(0.5, 1.0)
+    return min(retry_after, RATE_LIMIT_MAX_BACKOFF)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
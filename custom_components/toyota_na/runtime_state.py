@@ -0,0 +1,92 @@
+"""Runtime state of a config entry, persisted outside of the config entry data."""
+from datetime import datetime
+import logging
+from typing import Any, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+RUNTIME_STATE_STORAGE_VERSION = 1
+# Delay before writing, changes made within it are coalesced into a single write
+RUNTIME_STATE_SAVE_DELAY = 10
+# How long wake-up times are kept
+WAKE_HISTORY = 24 * 3600
+
+
+class RuntimeState:
+    """Tokens, refresh timestamps and wake-up counters of a config entry.
+
+    These change while the integration runs. Keeping them in ConfigEntry.data
+    would rewrite `core.config_entries` and fire the entry update listeners on
+    every change, so they live in their own storage file with debounced writes.
+    Pending changes are flushed when Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant, storage_key: str) -> None:
+        self._store = Store(hass, RUNTIME_STATE_STORAGE_VERSION, storage_key)
+        self._data: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load()
+        self._data = data if data is not None else {}
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def newest_tokens(self, entry_tokens: dict[str, Any]) -> dict[str, Any]:
+        """Return the most recently updated of the stored tokens and the tokens of the config entry.
+
+        The config entry tokens are newer after the config flow logged in again.
+        """
+        tokens = self._data.get("tokens")
+        if tokens is None or (entry_tokens.get("updated_at") or 0) > (tokens.get("updated_at") or 0):
+            return entry_tokens
+        return tokens
+
+    def set_tokens(self, tokens: dict[str, Any]) -> None:
+        _LOGGER.debug("Tokens refreshed, saving them")
+        self._data["tokens"] = tokens
+        self._schedule_save()
+
+    @property
+    def last_refreshed_at(self) -> Optional[float]:
+        return self._data.get("last_refreshed_at")
+
+    def set_last_refreshed_at(self, timestamp: float) -> None:
+        self._data["last_refreshed_at"] = timestamp
+        self._schedule_save()
+
+    def record_wake(self, vin: str, timestamp: Optional[float] = None) -> None:
+        """Count a wake-up (`poll_vehicle_refresh`) of a vehicle."""
+        if timestamp is None:
+            timestamp = datetime.utcnow().timestamp()
+        wakes = self._data.setdefault("wakes", {}).setdefault(vin, {"count": 0, "last_wake_at": None})
+        wakes["count"] += 1
+        wakes["last_wake_at"] = timestamp
+        # Recent wake-up times, for the rolling wake-up budget
+        wakes["recent"] = [
+            wake_at for wake_at in wakes.get("recent", []) if wake_at > timestamp - WAKE_HISTORY
+        ] + [timestamp]
+        self._schedule_save()
+
+    def wakes(self, vin: str) -> dict[str, Any]:
+        """Return the wake-up counter of a vehicle."""
+        return self._data.get("wakes", {}).get(vin, {"count": 0, "last_wake_at": None})
+
+    def recent_wakes(self, vin: str) -> list[float]:
+        """Return the times of the wake-ups of a vehicle within the last `WAKE_HISTORY` seconds, oldest first."""
+        return self.wakes(vin).get("recent", [])
+
+    def _schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: self._data, RUNTIME_STATE_SAVE_DELAY)
+
+    def as_dict(self) -> dict:
+        return {
+            "last_refreshed_at": self.last_refreshed_at,
+            "wakes": [
+                {"vin": vin, "count": wakes["count"], "last_wake_at": wakes["last_wake_at"]}
+                for vin, wakes in self._data.get("wakes", {}).items()
+            ],
+        }
@@ -0,0 +1,163 @@
+"""Per-endpoint, state-adaptive polling schedule for Toyota vehicles."""
+from datetime import datetime
+from enum import Enum, unique
+import logging
+from typing import Iterable, Optional
+
+from toyota_na.vehicle.base_vehicle import ToyotaVehicle, VehicleFeatures
+from toyota_na.vehicle.entity_types.ToyotaNumeric import ToyotaNumeric
+from toyota_na.vehicle.entity_types.ToyotaOpening import ToyotaOpening
+from toyota_na.vehicle.entity_types.ToyotaRemoteStart import ToyotaRemoteStart
+
+from .patch_base_vehicle import VehicleEndpoint
+from .stagger import next_due
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timers fire slightly late, so allow an endpoint to be polled a few seconds early
+SCHEDULE_TOLERANCE = 5
+
+# Format LastTimeStamp is stored in by the vehicle telemetry parsers (local time)
+LAST_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@unique
+class PollingMode(Enum):
+    Active = "active"
+    Normal = "normal"
+    Idle = "idle"
+
+
+class EndpointPollScheduler:
+    """Decides which endpoints of a vehicle are due and when to poll next.
+
+    Every endpoint has its own configured polling interval. The interval
+    actually used depends on the state of the vehicle:
+
+    * active (remote started, charging or moving): every endpoint is polled at
+      the minimum interval
+    * idle (locked and LastTimeStamp hasn't advanced for `idle_after`
+      seconds): every endpoint is polled at the maximum interval
+    * otherwise the configured interval, clamped to the min/max bounds
+
+    Polls of each vehicle fall in its own slot of the interval, so the
+    vehicles of every account are spread evenly across it.
+    """
+
+    def __init__(
+        self,
+        intervals: dict[VehicleEndpoint, int],
+        min_interval: int,
+        max_interval: int,
+        idle_after: int,
+    ) -> None:
+        self._intervals = intervals
+        self._min_interval = min_interval
+        self._max_interval = max(min_interval, max_interval)
+        self._idle_after = idle_after
+        self._modes: dict[str, PollingMode] = {}
+        self._polled_at: dict[tuple[str, VehicleEndpoint], float] = {}
+
+    def mode(self, vin: str) -> PollingMode:
+        return self._modes.get(vin, PollingMode.Normal)
+
+    def interval(self, vin: str, endpoint: VehicleEndpoint) -> int:
+        """Return the polling interval of an endpoint of a vehicle, in seconds."""
+        mode = self.mode(vin)
+        if mode is PollingMode.Active:
+            return self._min_interval
+        if mode is PollingMode.Idle:
+            return self._max_interval
+        return min(max(self._intervals[endpoint], self._min_interval), self._max_interval)
+
+    def due_at(self, vin: str, endpoint: VehicleEndpoint) -> Optional[float]:
+        """Return when an endpoint of a vehicle is due, None if it was never polled."""
+        polled_at = self._polled_at.get((vin, endpoint))
+        if polled_at is None:
+            return None
+        return next_due(vin, polled_at, self.interval(vin, endpoint))
+
+    def due_endpoints(self, vin: str, now: Optional[float] = None) -> set[VehicleEndpoint]:
+        """Return the endpoints of a vehicle that should be polled now."""
+        if now is None:
+            now = datetime.utcnow().timestamp()
+
+        due = set()
+        for endpoint in VehicleEndpoint:
+            due_at = self.due_at(vin, endpoint)
+            if due_at is None or now + SCHEDULE_TOLERANCE >= due_at:
+                due.add(endpoint)
+        return due
+
+    def mark_polled(self, vin: str, endpoints: set[VehicleEndpoint], now: Optional[float] = None) -> None:
+        """Record that the endpoints of a vehicle have just been polled."""
+        if now is None:
+            now = datetime.utcnow().timestamp()
+
+        for endpoint in endpoints:
+            self._polled_at[(vin, endpoint)] = now
+
+    def next_poll_in(self, vins: Iterable[str], now: Optional[float] = None) -> float:
+        """Return the number of seconds until the next endpoint of any of the vehicles is due."""
+        if now is None:
+            now = datetime.utcnow().timestamp()
+
+        next_poll_in = float(self._max_interval)
+        for vin in vins:
+            for endpoint in VehicleEndpoint:
+                due_at = self.due_at(vin, endpoint)
+                if due_at is None:
+                    return float(self._min_interval)
+                next_poll_in = min(next_poll_in, due_at - now)
+        return max(next_poll_in, float(self._min_interval))
+
+    def observe(self, vehicle: ToyotaVehicle, now: Optional[float] = None) -> PollingMode:
+        """Pick the polling mode of a vehicle from its current features."""
+        if now is None:
+            now = datetime.utcnow().timestamp()
+
+        if self._is_active(vehicle):
+            mode = PollingMode.Active
+        elif self._is_idle(vehicle, now):
+            mode = PollingMode.Idle
+        else:
+            mode = PollingMode.Normal
+
+        if self._modes.get(vehicle.vin) is not mode:
+            _LOGGER.debug(f"Vehicle {vehicle.vin} polling mode is now {mode.value}")
+        self._modes[vehicle.vin] = mode
+        return mode
+
+    def _is_active(self, vehicle: ToyotaVehicle) -> bool:
+        remote_start = vehicle.features.get(VehicleFeatures.RemoteStartStatus)
+        if isinstance(remote_start, ToyotaRemoteStart) and remote_start.on:
+            return True
+
+        # ChargingStatus is reported as an opening that is "open" while charging
+        charging = vehicle.features.get(VehicleFeatures.ChargingStatus)
+        if isinstance(charging, ToyotaOpening) and not charging.closed:
+            return True
+
+        speed = vehicle.features.get(VehicleFeatures.Speed)
+        if isinstance(speed, ToyotaNumeric):
+            try:
+                return float(speed.value) > 0
+            except (TypeError, ValueError):
+                pass
+
+        return False
+
+    def _is_idle(self, vehicle: ToyotaVehicle, now: float) -> bool:
+        last_timestamp = vehicle.features.get(VehicleFeatures.LastTimeStamp)
+        if not isinstance(last_timestamp, ToyotaNumeric):
+            return False
+        try:
+            reported_at = datetime.strptime(last_timestamp.value, LAST_TIMESTAMP_FORMAT).timestamp()
+        except (TypeError, ValueError):
+            return False
+        if now - reported_at < self._idle_after:
+            return False
+
+        # Only back off once every lock we know about is locked
+        lock_summary = vehicle.lock_summary
+        return lock_summary is None or lock_summary.all_locked
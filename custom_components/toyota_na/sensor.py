@@ -1,17 +1,20 @@
 from typing import Any, Union, cast
 
-from toyota_na.vehicle.base_vehicle import ToyotaVehicle, VehicleFeatures
+from toyota_na.vehicle.base_vehicle import RemoteRequestCommand, ToyotaVehicle, VehicleFeatures
 from toyota_na.vehicle.entity_types.ToyotaNumeric import ToyotaNumeric
 
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfLength
+from homeassistant.const import EntityCategory, UnitOfLength, UnitOfTime
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .base_entity import ToyotaNABaseEntity
-from .const import DOMAIN, SENSORS
+from .coordinator import ToyotaVehicleCoordinator
+from .const import COMMAND_LATENCY_SENSORS, DOMAIN, SENSORS
+from .latency import CommandLatencyTracker
+from .wake_budget import WakeBudget
 
 
 async def async_setup_entry(
@@ -22,11 +25,12 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     sensors = []
 
-    coordinator: DataUpdateCoordinator[list[ToyotaVehicle]] = hass.data[DOMAIN][
+    vehicle_coordinators: dict[str, ToyotaVehicleCoordinator] = hass.data[DOMAIN][
         config_entry.entry_id
-    ]["coordinator"]
+    ]["vehicle_coordinators"]
 
-    for vehicle in coordinator.data:
+    for coordinator in vehicle_coordinators.values():
+        vehicle = coordinator.vehicle
         for feature_sensor in SENSORS:
             feature = vehicle.features.get(
                 cast(VehicleFeatures, feature_sensor["feature"])
@@ -54,7 +58,33 @@ async def async_setup_entry(
                     )
                 )
 
-    async_add_devices(sensors, True)
+    command_latencies: CommandLatencyTracker = hass.data[DOMAIN][config_entry.entry_id][
+        "command_latencies"
+    ]
+    for coordinator in vehicle_coordinators.values():
+        vehicle = coordinator.vehicle
+        if vehicle.subscribed is False:
+            continue
+        for latency_sensor in COMMAND_LATENCY_SENSORS:
+            sensors.append(
+                ToyotaCommandLatencySensor(
+                    command_latencies,
+                    cast(RemoteRequestCommand, latency_sensor["command"]),
+                    cast(str, latency_sensor["icon"]),
+                    coordinator,
+                    latency_sensor["name"],
+                    vehicle.vin,
+                )
+            )
+
+    wake_budget: WakeBudget = hass.data[DOMAIN][config_entry.entry_id]["wake_budget"]
+    for coordinator in vehicle_coordinators.values():
+        vehicle = coordinator.vehicle
+        if vehicle.subscribed is False:
+            continue
+        sensors.append(ToyotaWakeCountSensor(wake_budget, coordinator, "Wake-ups Today", vehicle.vin))
+
+    async_add_devices(sensors)
 
 
 class ToyotaNumericSensor(ToyotaNABaseEntity):
@@ -74,6 +104,7 @@ class ToyotaNumericSensor(ToyotaNABaseEntity):
         self._state_class = state_class
         self._unit_of_measurement = unit_of_measurement
         self._vehicle_feature = vehicle_feature
+        self._watched_features = frozenset({vehicle_feature})
 
     @property
     def icon(self) -> str:
@@ -106,3 +137,86 @@ class ToyotaNumericSensor(ToyotaNABaseEntity):
                     return UnitOfLength.KILOMETERS
         
         return self._unit_of_measurement
+
+
+class ToyotaCommandLatencySensor(ToyotaNABaseEntity):
+    """Median time the vehicles of a generation take to confirm a remote command."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        command_latencies: CommandLatencyTracker,
+        command: RemoteRequestCommand,
+        icon: str,
+        *args: Any,
+    ):
+        super().__init__(*args)
+        self._command_latencies = command_latencies
+        self._command = command
+        self._icon = icon
+
+    @property
+    def icon(self) -> str:
+        return self._icon
+
+    @property
+    def state(self):
+        if self.vehicle is None:
+            return None
+        latency = self._command_latencies.percentile(self.vehicle.generation, self._command, 50)
+        return round(latency, 1) if latency is not None else None
+
+    @property
+    def state_class(self):
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def unit_of_measurement(self):
+        return UnitOfTime.SECONDS
+
+    @property
+    def extra_state_attributes(self):
+        if self.vehicle is None:
+            return None
+        p95 = self._command_latencies.percentile(self.vehicle.generation, self._command, 95)
+        return {
+            "p95": round(p95, 1) if p95 is not None else None,
+            "samples": self._command_latencies.samples(self.vehicle.generation, self._command),
+            "schedule": list(
+                self._command_latencies.confirmation_schedule(self.vehicle.generation, self._command)
+            ),
+        }
+
+
+class ToyotaWakeCountSensor(ToyotaNABaseEntity):
+    """Number of times the vehicle was woken up within the last 24 hours."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, wake_budget: WakeBudget, *args: Any):
+        super().__init__(*args)
+        self._wake_budget = wake_budget
+
+    @property
+    def icon(self) -> str:
+        return "mdi:car-clock"
+
+    @property
+    def state(self):
+        return self._wake_budget.wakes_today(self.vin)
+
+    @property
+    def state_class(self):
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def extra_state_attributes(self):
+        last_wake_at = self._wake_budget.last_wake_at(self.vin)
+        return {
+            "remaining": self._wake_budget.remaining(self.vin),
+            "daily_quota": self._wake_budget.daily_quota,
+            "last_wake_at": dt_util.utc_from_timestamp(last_wake_at).isoformat()
+            if last_wake_at is not None
+            else None,
+        }
@@ -0,0 +1,119 @@
+"""Persisted snapshot of the vehicle features, used to warm start the integration."""
+from datetime import datetime
+import logging
+from typing import Any, Optional
+
+from toyota_na.vehicle.base_vehicle import ToyotaVehicle, VehicleFeatures
+from toyota_na.vehicle.entity_types.ToyotaLocation import ToyotaLocation
+from toyota_na.vehicle.entity_types.ToyotaLockableOpening import ToyotaLockableOpening
+from toyota_na.vehicle.entity_types.ToyotaNumeric import ToyotaNumeric
+from toyota_na.vehicle.entity_types.ToyotaOpening import ToyotaOpening
+from toyota_na.vehicle.entity_types.ToyotaRemoteStart import ToyotaRemoteStart
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .vehicle_registry import ToyotaVehicleRegistry
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_STORAGE_VERSION = 1
+# Delay before writing the snapshot, the updates of all vehicles within it are saved at once
+SNAPSHOT_SAVE_DELAY = 30
+
+
+def serialize_feature(feature: Any) -> Optional[dict]:
+    """Return a JSON serializable representation of a vehicle feature."""
+    # Subclasses first, ToyotaLockableOpening is a ToyotaOpening
+    if isinstance(feature, ToyotaLockableOpening):
+        return {"type": "lockable_opening", "closed": feature.closed, "locked": feature.locked}
+    if isinstance(feature, ToyotaOpening):
+        return {"type": "opening", "closed": feature.closed}
+    if isinstance(feature, ToyotaLocation):
+        return {"type": "location", "lat": feature.lat, "long": feature.value}
+    if isinstance(feature, ToyotaNumeric):
+        return {"type": "numeric", "value": feature.value, "unit": feature.unit}
+    if isinstance(feature, ToyotaRemoteStart):
+        return {
+            "type": "remote_start",
+            "on": feature.on,
+            "start_time": feature.start_time.isoformat() if feature.start_time is not None else None,
+            "timer": feature.timer,
+        }
+    return None
+
+
+def deserialize_feature(data: dict) -> Any:
+    """Rebuild a vehicle feature from its serialized representation."""
+    feature_type = data["type"]
+    if feature_type == "lockable_opening":
+        return ToyotaLockableOpening(closed=data["closed"], locked=data["locked"])
+    if feature_type == "opening":
+        return ToyotaOpening(closed=data["closed"])
+    if feature_type == "location":
+        return ToyotaLocation(data["lat"], data["long"])
+    if feature_type == "numeric":
+        return ToyotaNumeric(data["value"], data["unit"])
+    if feature_type == "remote_start":
+        remote_start = ToyotaRemoteStart(date=None, on=data["on"], timer=data["timer"])
+        if data["start_time"] is not None:
+            remote_start.start_time = datetime.fromisoformat(data["start_time"])
+        return remote_start
+    raise ValueError(f"Unknown feature type {feature_type}")
+
+
+class FeatureSnapshot:
+    """Stores the last known features of every vehicle of a config entry.
+
+    Restoring it at setup lets the entities come up immediately, with the
+    vehicles marked stale until their first live update.
+    """
+
+    def __init__(self, hass: HomeAssistant, storage_key: str, registry: ToyotaVehicleRegistry) -> None:
+        self._store = Store(hass, SNAPSHOT_STORAGE_VERSION, storage_key)
+        self._registry = registry
+
+    async def async_restore(self) -> list[ToyotaVehicle]:
+        """Recreate the vehicles of the snapshot in the registry and return them."""
+        data = await self._store.async_load()
+        if not data:
+            return []
+
+        try:
+            vehicles = self._registry.restore_vehicles(
+                [snapshot["vehicle"] for snapshot in data["vehicles"]]
+            )
+            restored = {vehicle.vin: vehicle for vehicle in vehicles}
+            for snapshot in data["vehicles"]:
+                vehicle = restored.get(snapshot["vehicle"].get("vin"))
+                if vehicle is None:
+                    continue
+                for name, feature in snapshot["features"].items():
+                    if name in VehicleFeatures.__members__:
+                        vehicle.features[VehicleFeatures[name]] = deserialize_feature(feature)
+                vehicle.refresh_lock_summary()
+                vehicle.mark_stale()
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.warning(f"Ignoring unreadable vehicle snapshot: {e}")
+            self._registry.restore_vehicles([])
+            return []
+
+        _LOGGER.debug(f"Restored {len(vehicles)} vehicles from the snapshot")
+        return vehicles
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        vehicles = []
+        for vehicle in self._registry.vehicles:
+            features = {}
+            for feature, value in vehicle.features.items():
+                serialized = serialize_feature(value)
+                if serialized is not None:
+                    features[feature.name] = serialized
+            vehicles.append({"vehicle": self._registry.vehicle_metadata(vehicle), "features": features})
+        return {"vehicles": vehicles}
@@ -0,0 +1,37 @@
+"""Deterministic jitter spreading the polls and wake-ups of vehicles and accounts over time."""
+import hashlib
+
+# Slots of every interval dividing a day line up with each other
+STAGGER_PERIOD = 24 * 3600
+
+
+def stagger_fraction(key: str) -> float:
+    """Return a fraction in [0, 1) that is stable for `key` (a VIN or config entry id) across restarts."""
+    digest = hashlib.sha256(key.encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64
+
+
+def stagger_delay(key: str, window: float) -> float:
+    """Return the delay of `key` within a window, spreading keys evenly across it."""
+    return stagger_fraction(key) * window
+
+
+def next_slot(key: str, after: float, interval: float) -> float:
+    """Return the first time from `after` on that falls in the slot of `key` for an interval.
+
+    Every key gets its own phase, so keys polled on the same interval are
+    spread evenly across it instead of all firing at the same boundary.
+    """
+    if interval <= 0:
+        return after
+    phase = stagger_fraction(key) * STAGGER_PERIOD
+    return after + (phase - after) % interval
+
+
+def next_due(key: str, last: float, interval: float) -> float:
+    """Return when something last done at `last` is due again, in the slot of `key`.
+
+    The result is between half and one and a half intervals after `last`,
+    one interval on average.
+    """
+    return next_slot(key, last + interval / 2, interval)
@@ -0,0 +1,157 @@
+"""Keeps the access token of an account fresh ahead of its expiry."""
+import asyncio
+from datetime import datetime
+import logging
+from typing import Awaitable, Callable, Optional
+
+from toyota_na.auth import ToyotaOneAuth
+from toyota_na.exceptions import LoginError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+# Tokens are refreshed this long before they expire
+TOKEN_REFRESH_AHEAD = 600
+# Shortest delay between two scheduled refreshes, and delay before retrying a failed one
+TOKEN_RETRY_DELAY = 60
+
+
+class TokenManager:
+    """Refreshes the tokens of an account on a timer, ahead of their expiry.
+
+    Requests find a valid token instead of refreshing it inline. Concurrent
+    refreshes, including the ones triggered by requests rejected with a 401,
+    share a single in-flight refresh. When the refresh token is rejected the
+    manager logs in with the stored credentials, but only once per failure
+    episode; the episode ends with the next successful refresh or login.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        auth: ToyotaOneAuth,
+        relogin: Callable[[], Awaitable[None]],
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._auth = auth
+        self._relogin = relogin
+        self._refresh: Optional[asyncio.Future] = None
+        self._login_attempted = False
+        self._unsub_timer: Optional[CALLBACK_TYPE] = None
+        self.refreshes = 0
+        self.logins = 0
+        self.joined = 0
+        self.failures = 0
+
+    def expires_in(self, now: Optional[float] = None) -> Optional[float]:
+        """Return the number of seconds the access token stays valid, None without a token."""
+        expires_at = self._auth.get_tokens()["expires_at"]
+        if expires_at is None:
+            return None
+        if now is None:
+            now = datetime.utcnow().timestamp()
+        return expires_at - now
+
+    async def async_ensure_valid(self) -> None:
+        """Refresh the tokens now if they expire soon."""
+        expires_in = self.expires_in()
+        if expires_in is None or expires_in < TOKEN_REFRESH_AHEAD:
+            await self.async_refresh()
+
+    async def async_handle_unauthorized(self, access_token: str) -> None:
+        """Refresh the tokens after the API rejected `access_token`, unless they were replaced since."""
+        if self._auth.get_tokens()["access_token"] != access_token:
+            return
+        await self.async_refresh()
+
+    async def async_reauthenticate(self) -> None:
+        """Recover from every request of an update being rejected."""
+        if self._login_attempted:
+            raise ConfigEntryAuthFailed("Failed to authenticate with Toyota API")
+        await self.async_refresh()
+
+    async def async_refresh(self) -> None:
+        """Refresh the tokens, joining the refresh already in flight if any."""
+        if self._refresh is None:
+            self._refresh = asyncio.ensure_future(self._async_refresh())
+            self._refresh.add_done_callback(self._async_refresh_done)
+        else:
+            self.joined += 1
+        # A caller being cancelled must not cancel the refresh for the other callers
+        await asyncio.shield(self._refresh)
+
+    @callback
+    def _async_refresh_done(self, future: asyncio.Future) -> None:
+        self._refresh = None
+        if not future.cancelled():
+            # Mark the exception as retrieved, the callers get it through the shield
+            future.exception()
+
+    async def _async_refresh(self) -> None:
+        try:
+            await self._auth.refresh_tokens()
+            self.refreshes += 1
+            _LOGGER.debug("Refreshed Toyota API tokens")
+        except LoginError:
+            self.failures += 1
+            if self._login_attempted:
+                # Already logged in again during this episode, don't hammer the login servers
+                raise
+            _LOGGER.warning("Token refresh failed, attempting to re-login with username/password")
+            self._login_attempted = True
+            await self._relogin()
+            self.logins += 1
+        self._login_attempted = False
+        self._schedule()
+
+    @callback
+    def async_start(self) -> None:
+        """Start refreshing the tokens ahead of their expiry."""
+        self._schedule()
+
+    @callback
+    def async_stop(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def _schedule(self, delay: Optional[float] = None) -> None:
+        self.async_stop()
+        if delay is None:
+            expires_in = self.expires_in()
+            delay = TOKEN_RETRY_DELAY if expires_in is None else expires_in - TOKEN_REFRESH_AHEAD
+        self._unsub_timer = async_call_later(self._hass, max(delay, TOKEN_RETRY_DELAY), self._async_timer_fired)
+
+    @callback
+    def _async_timer_fired(self, _now: datetime) -> None:
+        self._unsub_timer = None
+        self._entry.async_create_background_task(
+            self._hass, self._async_scheduled_refresh(), f"toyota_na {self._entry.entry_id} token refresh"
+        )
+
+    async def _async_scheduled_refresh(self) -> None:
+        try:
+            await self.async_refresh()
+        except ConfigEntryAuthFailed:
+            self._entry.async_start_reauth(self._hass)
+        except Exception as e:
+            _LOGGER.warning(f"Scheduled token refresh failed, retrying in {TOKEN_RETRY_DELAY} seconds: {e}")
+            self._schedule(TOKEN_RETRY_DELAY)
+
+    def as_dict(self) -> dict:
+        expires_in = self.expires_in()
+        return {
+            "expires_in": round(expires_in) if expires_in is not None else None,
+            "refreshes": self.refreshes,
+            "logins": self.logins,
+            "joined": self.joined,
+            "failures": self.failures,
+            "login_attempted": self._login_attempted,
+        }
@@ -0,0 +1,113 @@
+"""Persistent per-entry registry of Toyota vehicle objects."""
+from datetime import datetime
+import logging
+from typing import Optional
+
+from toyota_na.client import ToyotaOneClient
+from toyota_na.vehicle.base_vehicle import ToyotaVehicle
+
+from .capabilities import EndpointCapabilities
+from .patch_vehicle import VEHICLE_METADATA_KEYS, apply_vehicle_metadata, create_vehicle, vehicle_class
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ToyotaVehicleRegistry:
+    """Keeps vehicle objects alive across coordinator polls.
+
+    The user vehicle list (subscriptions, nicknames, generation) only changes
+    rarely, so it is refetched on its own slow schedule or on demand. The
+    features of the vehicles already known are updated in place.
+    """
+
+    def __init__(
+        self,
+        client: ToyotaOneClient,
+        vehicle_list_interval: int,
+        capabilities: Optional[EndpointCapabilities] = None,
+    ) -> None:
+        self._client = client
+        self._capabilities = capabilities
+        self._vehicle_list_interval = vehicle_list_interval
+        self._vehicle_list_fetched_at: Optional[float] = None
+        self._vehicles: dict[str, ToyotaVehicle] = {}
+        self._metadata: dict[str, dict] = {}
+
+    @property
+    def vehicles(self) -> list[ToyotaVehicle]:
+        return list(self._vehicles.values())
+
+    @property
+    def vehicles_by_vin(self) -> dict[str, ToyotaVehicle]:
+        """Return the known vehicles indexed by VIN."""
+        return dict(self._vehicles)
+
+    def vehicle_metadata(self, vehicle: ToyotaVehicle) -> dict:
+        """Return the vehicle list entry a vehicle was built from, limited to the keys needed to recreate it."""
+        return self._metadata.get(vehicle.vin, {})
+
+    def restore_vehicles(self, api_vehicles: list[dict]) -> list[ToyotaVehicle]:
+        """Create the vehicles from saved vehicle list entries, without calling the API.
+
+        The vehicle list is still fetched on the next update.
+        """
+        self._set_vehicles(
+            {
+                api_vehicle.get("vin", "Unknown"): (api_vehicle, create_vehicle(self._client, api_vehicle))
+                for api_vehicle in api_vehicles
+                if vehicle_class(api_vehicle) is not None
+            }
+        )
+        self._vehicle_list_fetched_at = None
+        return self.vehicles
+
+    def vehicle_list_due(self) -> bool:
+        """Return True if the vehicle list should be refetched."""
+        if self._vehicle_list_fetched_at is None:
+            return True
+        return datetime.utcnow().timestamp() - self._vehicle_list_fetched_at >= self._vehicle_list_interval
+
+    def request_vehicle_list_refresh(self) -> None:
+        """Refetch the vehicle list on the next update."""
+        self._vehicle_list_fetched_at = None
+
+    async def async_refresh_vehicle_list(self) -> None:
+        """Fetch the user vehicle list and reconcile it with the known vehicles."""
+        _LOGGER.debug("Fetching vehicle list from Toyota API")
+        api_vehicles = await self._client.get_user_vehicle_list()
+        _LOGGER.debug("Toyota API returned %d vehicles", len(api_vehicles))
+
+        vehicles: dict[str, tuple[dict, ToyotaVehicle]] = {}
+        for api_vehicle in api_vehicles:
+            vehicle_cls = vehicle_class(api_vehicle)
+            if vehicle_cls is None:
+                continue
+
+            existing = self._vehicles.get(api_vehicle.get("vin", "Unknown"))
+            if existing is not None and type(existing) is vehicle_cls:
+                # Keep the vehicle object and its features, only refresh metadata
+                apply_vehicle_metadata(existing, api_vehicle)
+                vehicles[existing.vin] = (api_vehicle, existing)
+            else:
+                vehicle_obj = create_vehicle(self._client, api_vehicle)
+                vehicles[vehicle_obj.vin] = (api_vehicle, vehicle_obj)
+
+        self._set_vehicles(vehicles)
+        self._vehicle_list_fetched_at = datetime.utcnow().timestamp()
+
+    def _set_vehicles(self, vehicles: dict[str, tuple[dict, ToyotaVehicle]]) -> None:
+        self._vehicles = {}
+        self._metadata = {}
+        for vin, (api_vehicle, vehicle_obj) in vehicles.items():
+            vehicle_obj.capabilities = self._capabilities
+            self._vehicles[vin] = vehicle_obj
+            self._metadata[vin] = {key: api_vehicle[key] for key in VEHICLE_METADATA_KEYS if key in api_vehicle}
+
+    async def async_update(self) -> dict[str, ToyotaVehicle]:
+        """Refresh the vehicle list when due and return the known vehicles indexed by VIN.
+
+        Vehicle features are updated by each vehicle's own coordinator.
+        """
+        if self.vehicle_list_due():
+            await self.async_refresh_vehicle_list()
+        return self.vehicles_by_vin
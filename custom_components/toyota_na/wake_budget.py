@@ -0,0 +1,87 @@
+"""Budget of the wake-ups (`poll_vehicle_refresh`) spent on each vehicle."""
+from datetime import datetime
+import logging
+from typing import Optional
+
+from .runtime_state import WAKE_HISTORY, RuntimeState
+from .stagger import next_due
+
+_LOGGER = logging.getLogger(__name__)
+
+# Wake-ups of the daily quota only user requests may use
+USER_WAKE_RESERVE = 2
+# Minimum time between two user requested wake-ups of a vehicle
+USER_WAKE_MIN_SPACING = 60
+# Vehicles parked and locked for a while are woken up on schedule at most this often
+IDLE_WAKE_MIN_SPACING = 24 * 3600
+
+
+class WakeBudget:
+    """Decides whether a vehicle may be woken up, from its wake-ups of the last 24 hours.
+
+    Every wake-up makes the vehicle's telematics unit draw from the 12V
+    battery, so each vehicle gets a rolling daily quota. Scheduled wake-ups
+    keep a minimum spacing and leave part of the quota to user requests,
+    which only have to respect a short spacing so fresh data still comes when
+    someone asks. Scheduled wake-ups of each vehicle fall in its own slot of
+    the spacing so vehicles aren't woken together. Idle vehicles are woken on schedule at most once a day.
+    """
+
+    def __init__(self, runtime_state: RuntimeState, daily_quota: int, scheduled_spacing: int) -> None:
+        self._runtime_state = runtime_state
+        self._daily_quota = daily_quota
+        self._scheduled_spacing = scheduled_spacing
+
+    @property
+    def daily_quota(self) -> int:
+        return self._daily_quota
+
+    def wakes_today(self, vin: str, now: Optional[float] = None) -> int:
+        """Return the number of wake-ups of the vehicle within the last 24 hours."""
+        if now is None:
+            now = datetime.utcnow().timestamp()
+        return sum(1 for wake_at in self._runtime_state.recent_wakes(vin) if wake_at > now - WAKE_HISTORY)
+
+    def remaining(self, vin: str, now: Optional[float] = None) -> int:
+        return max(self._daily_quota - self.wakes_today(vin, now), 0)
+
+    def last_wake_at(self, vin: str) -> Optional[float]:
+        last_wake_at = self._runtime_state.wakes(vin)["last_wake_at"]
+        if last_wake_at is None:
+            # Vehicles of entries set up before wake-ups were counted per vehicle
+            last_wake_at = self._runtime_state.last_refreshed_at
+        return last_wake_at
+
+    def allow_scheduled(self, vin: str, idle: bool = False, now: Optional[float] = None) -> bool:
+        """Return True if a scheduled wake-up of the vehicle fits the budget."""
+        if now is None:
+            now = datetime.utcnow().timestamp()
+        last_wake_at = self.last_wake_at(vin)
+        spacing = IDLE_WAKE_MIN_SPACING if idle else self._scheduled_spacing
+        if last_wake_at is not None:
+            # Never closer than the spacing, and then in the vehicle's own slot, not together with the others
+            if now - last_wake_at < spacing or now < next_due(vin, last_wake_at, spacing):
+                return False
+        if self.wakes_today(vin, now) >= self._daily_quota - USER_WAKE_RESERVE:
+            _LOGGER.debug(f"Scheduled wake-up budget of vehicle {vin} spent for today")
+            return False
+        return True
+
+    def allow_user(self, vin: str, now: Optional[float] = None) -> bool:
+        """Return True if a user requested wake-up of the vehicle fits the budget."""
+        if now is None:
+            now = datetime.utcnow().timestamp()
+        last_wake_at = self._runtime_state.wakes(vin)["last_wake_at"]
+        if last_wake_at is not None and now - last_wake_at < USER_WAKE_MIN_SPACING:
+            return False
+        return self.wakes_today(vin, now) < self._daily_quota
+
+    def record(self, vin: str) -> None:
+        self._runtime_state.record_wake(vin)
+
+    def as_dict(self) -> dict:
+        return {
+            "daily_quota": self._daily_quota,
+            "user_reserve": USER_WAKE_RESERVE,
+            "scheduled_spacing": self._scheduled_spacing,
+        }